@@ -1,26 +1,163 @@
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.cluster import KMeans
-import jieba
-import re
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
 
-def clean_text(t):
-    return re.sub(r"[^\u4e00-\u9fa5a-zA-Z0-9]+", " ", t)
+import numpy as np
+import scipy.sparse as sp
+from sklearn.feature_extraction.text import TfidfTransformer, TfidfVectorizer
+from sklearn.cluster import KMeans, MiniBatchKMeans
+from sklearn.metrics import silhouette_score
+from .schema import Item
+from .segment import PARALLEL_MIN, clean_text, tokenize, warm_up
+
+WORKERS = int(os.environ.get("AGGREGATOR_WORKERS", "0")) or (os.cpu_count() or 1)
+# 自动选 k 的时间预算（秒）与簇中心内存预算（字节）
+TIME_BUDGET = float(os.environ.get("AGGREGATOR_CLUSTER_SECONDS", "10"))
+MEMORY_BUDGET = int(os.environ.get("AGGREGATOR_CLUSTER_MEMORY_MB", "64")) * 1024 * 1024
+# 条目数达到该值时 build_clusters 改用 MiniBatchKMeans
+MINIBATCH_MIN = 5000
+SELECT_SAMPLE = 3000
+KEYWORDS = 5
+
+def _count_shard(texts):
+    """子进程：切分一个分片并计数，只回传本分片词表与计数矩阵（词表序号即列号）"""
+    vocab = {}
+    indices, indptr = [], [0]
+    for text in texts:
+        for tok in tokenize(text.lower()):
+            indices.append(vocab.setdefault(tok, len(vocab)))
+        indptr.append(len(indices))
+    data = np.ones(len(indices), dtype=np.int64)
+    counts = sp.csr_matrix((data, indices, indptr), shape=(len(texts), len(vocab)))
+    counts.sum_duplicates()
+    return list(vocab), counts
+
+def _parallel_counts(texts, workers):
+    size = -(-len(texts) // workers)
+    shards = [texts[i:i + size] for i in range(0, len(texts), size)]
+    with ProcessPoolExecutor(max_workers=workers, initializer=warm_up) as pool:
+        results = list(pool.map(_count_shard, shards))
+
+    # 合并词表（按字母序，与 CountVectorizer 一致），分片列号映射到全局列号后纵向拼接
+    terms = sorted({tok for vocab, _ in results for tok in vocab})
+    column = {tok: i for i, tok in enumerate(terms)}
+    blocks = []
+    for vocab, counts in results:
+        mapping = np.array([column[tok] for tok in vocab], dtype=counts.indices.dtype)
+        blocks.append(sp.csr_matrix(
+            (counts.data, mapping[counts.indices], counts.indptr),
+            shape=(counts.shape[0], len(terms)),
+        ))
+    return sp.vstack(blocks).tocsr(), np.array(terms, dtype=object)
+
+def extract_features(texts, max_features=500, workers=None):
+    """
+    清洗后的文本 → TF-IDF 矩阵与特征词
+    文本达到 PARALLEL_MIN 条且 workers > 1 时按分片并行切分计数，子进程只回传稀疏计数与词表，
+    再按 CountVectorizer 的规则（总词频前 max_features 个）选词，结果与串行 TfidfVectorizer 相同
+    """
+    workers = workers or WORKERS
+    if workers <= 1 or len(texts) < PARALLEL_MIN:
+        vectorizer = TfidfVectorizer(tokenizer=tokenize, max_features=max_features)
+        X = vectorizer.fit_transform(texts)
+        return X, vectorizer.get_feature_names_out()
+
+    counts, terms = _parallel_counts(texts, workers)
+    if max_features is not None and max_features < len(terms):
+        tfs = np.asarray(counts.sum(axis=0)).ravel()
+        keep = np.zeros(len(terms), dtype=bool)
+        keep[(-tfs).argsort()[:max_features]] = True
+        kept = np.flatnonzero(keep)
+        counts, terms = counts[:, kept], terms[kept]
+    return TfidfTransformer().fit_transform(counts), terms
+
+def _auto_k(X, k_max, time_budget, started):
+    """
+    在 2..k_max 的几何序列上依次试 k：抽样拟合 MiniBatchKMeans 并计算余弦轮廓系数，取最高者
+    超出时间预算即停止，用已试过的最优 k
+    """
+    rows = X.shape[0]
+    rnd = np.random.RandomState(42)
+    sample = X[rnd.choice(rows, SELECT_SAMPLE, replace=False)] if rows > SELECT_SAMPLE else X
+    best_k, best_score = 2, -1.0
+    for k in sorted({int(round(k)) for k in np.geomspace(2, k_max, 8)}):
+        if k >= sample.shape[0]:
+            break
+        labels = MiniBatchKMeans(n_clusters=k, random_state=42, n_init=3, batch_size=1024).fit_predict(sample)
+        if len(set(labels)) > 1:
+            score = silhouette_score(sample, labels, metric="cosine", random_state=42)
+            if score > best_score:
+                best_k, best_score = k, score
+        if time.perf_counter() - started > time_budget:
+            break
+    return best_k
+
+def build_clusters(
+    items,
+    n_clusters=None,
+    max_features=2000,
+    workers=None,
+    time_budget=TIME_BUDGET,
+    memory_budget=MEMORY_BUDGET,
+    minibatch_min=MINIBATCH_MIN,
+):
+    """
+    聚类标题（str 或 Item），返回 (簇列表, 各阶段耗时秒数)
+    - 特征为稀疏 TF-IDF；KMeans/MiniBatchKMeans 的簇中心是稠密的 k × 特征数 矩阵，
+      k 的上限由 memory_budget 约束
+    - n_clusters 为 None 时在时间预算内自动选择 k
+    - 条目数达到 minibatch_min 时改用 MiniBatchKMeans，避免每轮迭代遍历全量数据；
+      其簇划分是近似结果，与 KMeans 不同。minibatch_min=None 时始终用 KMeans
+    - 每个簇附带簇中心权重最高的关键词
+    """
+    titles = [it.title if isinstance(it, Item) else it for it in items]
+    timings = {}
+    started = time.perf_counter()
+    if not titles:
+        return [], timings
 
-def cluster_topics(titles, n_clusters=6):
     texts = [clean_text(t) for t in titles]
-    if not texts: return []
-    vectorizer = TfidfVectorizer(
-        tokenizer=lambda x: jieba.lcut(x),
-        max_features=500
-    )
-    X = vectorizer.fit_transform(texts)
-    km = KMeans(n_clusters=min(n_clusters, len(texts)), random_state=42)
+    X, terms = extract_features(texts, max_features=max_features, workers=workers)
+    timings["features"] = time.perf_counter() - started
+
+    rows, features = X.shape
+    k_max = max(2, min(rows - 1, int(math.sqrt(rows)) * 2, memory_budget // (8 * max(1, features))))
+    if n_clusters is None:
+        mark = time.perf_counter()
+        n_clusters = _auto_k(X, k_max, time_budget, mark) if rows > 2 else 1
+        timings["select_k"] = time.perf_counter() - mark
+    n_clusters = max(1, min(n_clusters, rows))
+
+    mark = time.perf_counter()
+    if minibatch_min is not None and rows >= minibatch_min:
+        km = MiniBatchKMeans(n_clusters=n_clusters, random_state=42, n_init=3, batch_size=1024)
+    else:
+        km = KMeans(n_clusters=n_clusters, random_state=42, n_init=10)
     km.fit(X)
+    timings["fit"] = time.perf_counter() - mark
+
     labels = km.labels_
     clusters = {}
     for i, label in enumerate(labels):
         clusters.setdefault(label, []).append(titles[i])
-    # 取每个聚类的代表词
-    return [
-        {"cluster": i, "samples": v[:5]} for i, v in clusters.items()
-    ]
+    centers = km.cluster_centers_
+    result = []
+    for label, members in clusters.items():
+        # 切分结果中的空白也是特征，不作为关键词
+        top = [j for j in np.argsort(-centers[label]) if centers[label][j] > 0 and terms[j].strip()]
+        result.append({
+            "cluster": label,
+            "size": len(members),
+            "keywords": [str(terms[j]) for j in top[:KEYWORDS]],
+            "samples": members[:5],
+        })
+    timings["total"] = time.perf_counter() - started
+    return result, timings
+
+def cluster_topics(titles, n_clusters=6, workers=None):
+    """固定 k 聚类，始终使用 KMeans，不会因条目数多而切换为 MiniBatchKMeans"""
+    clusters, _ = build_clusters(
+        titles, n_clusters=n_clusters, max_features=500, workers=workers, minibatch_min=None
+    )
+    return clusters
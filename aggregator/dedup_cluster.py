@@ -1,4 +1,7 @@
 # -*- coding: utf-8 -*-
+import json
+import os
+from collections import Counter, defaultdict
 from typing import List, Dict, Tuple
 from .schema import Item, norm_text, stable_id
 
@@ -12,33 +15,152 @@ def title_sim(a: str, b: str) -> float:
     union = len(ta | tb)
     return inter / union
 
-def cluster_items(items: List[Item], threshold: float = 0.85) -> List[Dict]:
-    topics: List[Dict] = []
-    for it in items:
-        placed = False
-        for tp in topics:
-            # 用簇代表标题做快速判断
-            if title_sim(tp["rep_title"], it.title) >= threshold:
+def _tokens(title: str) -> frozenset:
+    return frozenset(norm_text(title).split())
+
+class TopicStore:
+    """
+    增量贪心聚类：每条依次归入第一个代表标题相似度 >= threshold 的簇，否则新建簇
+    簇状态可落盘，定时任务每次运行只把新条目归入已有簇，簇 id（代表标题 hash）当天保持不变
+    与逐簇比对结果一致，但只比较可能达到阈值的簇：
+    - 代表标题的 token 集合只计算一次
+    - token 按出现次数由少到多排序（次数取自首批条目并固定下来，之后出现的新 token 记为 0），
+      Jaccard >= t 的两个集合在各自前 l - floor(t*l) + 1 个 token 中必有共同 token（前缀过滤），
+      倒排索引 token → 簇序号 只收录代表标题的前缀 token
+    """
+
+    VERSION = 1
+
+    def __init__(self, threshold: float = 0.85, day: str = ""):
+        self.threshold = threshold
+        self.day = day
+        self.freq: Dict[str, int] = {}
+        self.topics: List[Dict] = []
+        self.index: Dict[str, List[int]] = defaultdict(list)
+        self.rep_tokens: List[frozenset] = []
+        self.item_topic: Dict[str, str] = {}
+
+    def _prefix(self, tokens: frozenset) -> List[str]:
+        ordered = sorted(tokens, key=lambda tok: (self.freq.get(tok, 0), tok))
+        return ordered[:len(ordered) - int(self.threshold * len(ordered)) + 1]
+
+    def _new_topic(self, it: Item, tokens: frozenset, prefix: List[str]) -> None:
+        for tok in prefix:
+            self.index[tok].append(len(self.topics))
+        self.rep_tokens.append(tokens)
+        self.topics.append({
+            "topic": stable_id(it.title[:64]),   # 代表标题 hash
+            "rep_title": it.title,
+            "items": [it],
+            "min_ts": it.ts,
+            "max_ts": it.ts,
+        })
+
+    def add(self, items: List[Item]) -> List[str]:
+        """归类一批条目，返回各条目的簇 id；之前批次已归类过的条目（按 id）不重复加入"""
+        known = set(self.item_topic)
+        token_lists = [_tokens(it.title) for it in items]
+        if not self.freq:
+            self.freq = dict(Counter(tok for tokens in token_lists for tok in tokens))
+
+        assigned = []
+        for it, tokens in zip(items, token_lists):
+            if it.id in known:
+                assigned.append(self.item_topic[it.id])
+                continue
+            prefix = self._prefix(tokens)
+            target = None
+            if self.threshold <= 0:
+                # 相似度恒 >= 0，第一个簇即命中
+                target = 0 if self.topics else None
+            elif tokens:
+                candidates = set()
+                for tok in prefix:
+                    candidates.update(self.index.get(tok, ()))
+                for t in sorted(candidates):
+                    rep = self.rep_tokens[t]
+                    inter = len(tokens & rep)
+                    if inter / (len(tokens) + len(rep) - inter) >= self.threshold:
+                        target = t
+                        break
+
+            if target is not None:
+                tp = self.topics[target]
                 tp["items"].append(it)
                 # 更新时间范围
                 tp["min_ts"] = min(tp["min_ts"], it.ts)
                 tp["max_ts"] = max(tp["max_ts"], it.ts)
-                placed = True
-                break
-        if not placed:
-            topics.append({
-                "topic": stable_id(it.title[:64]),   # 代表标题 hash
-                "rep_title": it.title,
-                "items": [it],
-                "min_ts": it.ts,
-                "max_ts": it.ts,
-            })
-    # 附加统计
-    for tp in topics:
-        srcs = {i.source for i in tp["items"]}
-        tp["sources"] = sorted(list(srcs))
-        tp["cover"] = len(srcs)
-        tp["size"] = len(tp["items"])
-    # 简单排序：先按覆盖平台数，再按最新时间
-    topics.sort(key=lambda x: (x["cover"], x["max_ts"]), reverse=True)
-    return topics
+            else:
+                target = len(self.topics)
+                self._new_topic(it, tokens, prefix)
+            self.item_topic[it.id] = self.topics[target]["topic"]
+            assigned.append(self.topics[target]["topic"])
+        return assigned
+
+    def ranked_topics(self) -> List[Dict]:
+        topics = [dict(tp, items=list(tp["items"])) for tp in self.topics]
+        # 附加统计
+        for tp in topics:
+            srcs = {i.source for i in tp["items"]}
+            tp["sources"] = sorted(list(srcs))
+            tp["cover"] = len(srcs)
+            tp["size"] = len(tp["items"])
+        # 简单排序：先按覆盖平台数，再按最新时间
+        topics.sort(key=lambda x: (x["cover"], x["max_ts"]), reverse=True)
+        return topics
+
+    def save(self, path: str) -> None:
+        """原子写入簇状态"""
+        data = {
+            "version": self.VERSION,
+            "day": self.day,
+            "threshold": self.threshold,
+            "freq": self.freq,
+            "topics": [
+                dict(tp, items=[i.asdict() for i in tp["items"]]) for tp in self.topics
+            ],
+        }
+        tmp_path = f"{path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_path, path)
+        except Exception as e:
+            print(f"[topics] save failed: {e}")
+
+    @classmethod
+    def load(cls, path: str, threshold: float = 0.85, day: str = "") -> "TopicStore":
+        """读取簇状态；文件缺失、损坏、版本/阈值不符或已跨天时返回空状态"""
+        store = cls(threshold, day)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return store
+        except Exception as e:
+            print(f"[topics] load failed: {e}")
+            return store
+        if (
+            data.get("version") != cls.VERSION
+            or data.get("threshold") != threshold
+            or data.get("day") != day
+        ):
+            return store
+
+        store.freq = data["freq"]
+        for tp in data["topics"]:
+            items = [Item(**i) for i in tp["items"]]
+            tokens = _tokens(tp["rep_title"])
+            store._new_topic(items[0], tokens, store._prefix(tokens))
+            restored = store.topics[-1]
+            restored.update(tp, items=items)
+            for it in items:
+                store.item_topic[it.id] = restored["topic"]
+        return store
+
+
+def cluster_items(items: List[Item], threshold: float = 0.85) -> List[Dict]:
+    store = TopicStore(threshold)
+    store.add(items)
+    return store.ranked_topics()
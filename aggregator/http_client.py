@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""聚合器共享的 HTTP 会话：连接池复用，避免每次请求重新握手"""
+import os
+from typing import Dict
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_TIMEOUT = float(os.environ.get("AGGREGATOR_HTTP_TIMEOUT", "10"))
+POOL_MAXSIZE = int(os.environ.get("AGGREGATOR_POOL_MAXSIZE", "4"))
+PROXY_URL = os.environ.get("AGGREGATOR_PROXY", "").strip()
+
+_session = None
+_adapter = None
+
+
+def get_session() -> requests.Session:
+    """获取全局共享的会话（首次调用时创建）"""
+    global _session, _adapter
+    if _session is None:
+        _adapter = HTTPAdapter(pool_maxsize=POOL_MAXSIZE)
+        _session = requests.Session()
+        _session.mount("http://", _adapter)
+        _session.mount("https://", _adapter)
+        if PROXY_URL:
+            _session.proxies = {"http": PROXY_URL, "https": PROXY_URL}
+    return _session
+
+
+def get_json(url: str, timeout: float = DEFAULT_TIMEOUT, **kwargs):
+    """GET 并解析 JSON"""
+    return get_session().get(url, timeout=timeout, **kwargs).json()
+
+
+def connection_stats() -> Dict[str, int]:
+    """统计新建与复用的连接数"""
+    if _adapter is None:
+        return {"requests": 0, "new": 0, "reused": 0}
+    managers = [_adapter.poolmanager, *_adapter.proxy_manager.values()]
+    pools = [m.pools[key] for m in managers for key in m.pools.keys()]
+    new_connections = sum(p.num_connections for p in pools)
+    total_requests = sum(p.num_requests for p in pools)
+    return {
+        "requests": total_requests,
+        "new": new_connections,
+        "reused": max(0, total_requests - new_connections),
+    }
@@ -1,8 +1,28 @@
 import json
+import os
 from datetime import datetime
 from .zh_sources import collect_chinese_trends
 from .sources_rss import collect_english_trends
 from .score import compute_heat_score
+from .http_client import connection_stats
+from .dedup_cluster import TopicStore
+from .schema import Item
+
+# 当天话题聚类状态，每次运行把新条目归入已有话题
+TOPIC_STATE = os.environ.get("AGGREGATOR_TOPIC_STATE", "output/aggregator/topics.json")
+
+def assign_topics(trends):
+    """为每条热点标注当天稳定的话题 id，并保存聚类状态"""
+    day = datetime.now().strftime("%Y-%m-%d")
+    store = TopicStore.load(TOPIC_STATE, day=day)
+    items = [
+        Item.make(t["title"], t.get("url", ""), t["source"], ts=t.get("ts"))
+        for t in trends
+    ]
+    for trend, topic in zip(trends, store.add(items)):
+        trend["topic"] = topic
+    store.save(TOPIC_STATE)
+    return len(store.topics)
 
 def main():
     zh_trends = collect_chinese_trends()
@@ -11,6 +31,7 @@ def main():
 
     # 计算热度
     all_trends = compute_heat_score(all_trends)
+    topic_total = assign_topics(all_trends)
 
     out = {
         "generated_at": datetime.now().isoformat(),
@@ -23,6 +44,9 @@ def main():
         json.dump(out, f, ensure_ascii=False, indent=2)
 
     print(f"[OK] Generated {len(all_trends)} topics from {out['source_count']} sources.")
+    print(f"[topics] {topic_total} clusters today, state: {TOPIC_STATE}")
+    stats = connection_stats()
+    print(f"[http] requests={stats['requests']} new={stats['new']} reused={stats['reused']}")
 
 if __name__ == "__main__":
     main()
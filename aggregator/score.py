@@ -1,6 +1,14 @@
+import os
 from collections import Counter
 import re
 from difflib import SequenceMatcher
+from typing import List, Optional
+
+import numpy as np
+import scipy.sparse as sp
+
+# 相似标题判定阈值（calc_similarity 大于该值视为同类标题）
+SIM_THRESHOLD = float(os.environ.get("AGGREGATOR_SIM_THRESHOLD", "0.6"))
 
 def normalize_title(title: str) -> str:
     """去除符号与空格用于比对"""
@@ -10,7 +18,93 @@ def calc_similarity(a: str, b: str) -> float:
     """标题相似度（0~1）"""
     return SequenceMatcher(None, a, b).ratio()
 
-def compute_heat_score(items, sim_threshold=0.6):
+def _char_tokens(text: str) -> List[tuple]:
+    """字符多重集展开为 (字符, 第几次出现) 集合，集合交集大小即多重集交集大小"""
+    seen = {}
+    tokens = []
+    for ch in text:
+        k = seen.get(ch, 0)
+        seen[ch] = k + 1
+        tokens.append((ch, k))
+    return tokens
+
+def _bigram_matrix(titles: List[str]):
+    """标题 → 字符二元组（含首尾标记）0/1 稀疏矩阵，单字标题也至少有两个特征；空标题为空行"""
+    vocab = {}
+    rows, cols = [], []
+    for i, title in enumerate(titles):
+        if not title:
+            continue
+        padded = "\x02" + title + "\x03"
+        for gram in {padded[k:k + 2] for k in range(len(padded) - 1)}:
+            rows.append(i)
+            cols.append(vocab.setdefault(gram, len(vocab)))
+    data = np.ones(len(rows), dtype=np.int32)
+    return sp.csr_matrix((data, (rows, cols)), shape=(len(titles), len(vocab)))
+
+def similar_title_counts(
+    titles: List[str],
+    sim_threshold: float = SIM_THRESHOLD,
+    candidate_threshold: Optional[float] = None,
+    max_df: float = 0.05,
+    chunk_size: int = 2000,
+) -> List[int]:
+    """
+    统计每个标题的相似标题数量（calc_similarity(this, other) > sim_threshold）
+    两两比对是 O(n²) 次 SequenceMatcher，这里改为稀疏矩阵相似度连接：
+    - 标题表示为字符二元组集合，按块计算 X·Xᵀ 得到共有二元组数，
+      Dice 系数不低于 candidate_threshold（默认阈值的 1/3）的标题对进入候选
+    - 出现在超过 max_df 比例标题中的二元组不参与候选生成，避免高频字组合拉出大量无关对
+    - 候选对再经长度上界与字符多重集交集上界过滤（ratio = 2M/(la+lb)，M 不超过交集），
+      最后用 calc_similarity 双向确认，因此不会多计，只可能因候选阶段漏掉极少数标题对
+    """
+    n = len(titles)
+    counts = [0] * n
+    if n < 2 or sim_threshold >= 1.0:
+        return counts
+    if sim_threshold < 0:
+        return [n - 1] * n
+    if candidate_threshold is None:
+        candidate_threshold = sim_threshold / 3
+
+    # 两个空标题的相似度为 1.0
+    empty = [i for i, title in enumerate(titles) if not title]
+    if len(empty) > 1:
+        for i in empty:
+            counts[i] = len(empty) - 1
+
+    X = _bigram_matrix(titles)
+    grams = np.asarray(X.sum(axis=1)).ravel()
+    df = np.bincount(X.indices, minlength=X.shape[1])
+    X = X[:, np.flatnonzero(df <= max(50, max_df * n))].tocsr()
+    XT = X.T.tocsr()
+    lengths = np.array([len(title) for title in titles])
+    token_sets = [frozenset(_char_tokens(title)) for title in titles]
+
+    for start in range(0, n, chunk_size):
+        shared = (X[start:start + chunk_size] @ XT).tocoo()
+        x = shared.row + start
+        y = shared.col
+        # 只看上三角，每对标题处理一次
+        keep = y > x
+        x, y, common = x[keep], y[keep], shared.data[keep]
+        keep = 2.0 * common / (grams[x] + grams[y]) >= candidate_threshold
+        x, y = x[keep], y[keep]
+        total = lengths[x] + lengths[y]
+        keep = 2.0 * np.minimum(lengths[x], lengths[y]) / total > sim_threshold
+        x, y, total = x[keep], y[keep], total[keep]
+
+        for a, b, ab in zip(x.tolist(), y.tolist(), total.tolist()):
+            if 2.0 * len(token_sets[a] & token_sets[b]) / ab <= sim_threshold:
+                continue
+            if calc_similarity(titles[a], titles[b]) > sim_threshold:
+                counts[a] += 1
+            if calc_similarity(titles[b], titles[a]) > sim_threshold:
+                counts[b] += 1
+
+    return counts
+
+def compute_heat_score(items, sim_threshold=SIM_THRESHOLD):
     """
     基于相似标题与多源出现频率计算热度分数
     - 出现次数越多、跨源越多 → 热度越高
@@ -21,15 +115,13 @@ def compute_heat_score(items, sim_threshold=0.6):
     scores = []
     normalized = [normalize_title(i["title"]) for i in items]
     source_counter = Counter([i["source"] for i in items])
+    similar_counts = similar_title_counts(normalized, sim_threshold)
 
     for idx, item in enumerate(items):
         score = 1.0  # 基础分
-        this = normalized[idx]
 
-        # 同类标题重复加权（idx 对应当前项）
-        for j, other in enumerate(normalized):
-            if idx != j and calc_similarity(this, other) > sim_threshold:
-                score += 0.5
+        # 同类标题重复加权
+        score += similar_counts[idx] * 0.5
 
         # 来源权重（来源重复次数轻微加权）
         score += source_counter[item["source"]] * 0.1
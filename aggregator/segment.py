@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""
+分词服务：聚类与关键词匹配共用
+- jieba 词典只加载一次（首次加载 1s+）；AGGREGATOR_JIEBA_CACHE 可指定词典缓存文件，
+  便于容器/CI 持久化，免去重建前缀词典
+- 按清洗后的标题做有界 LRU 缓存，同一标题只切分一次
+- tokenize 是模块级函数，可被 pickle，供 TfidfVectorizer 与多进程使用
+"""
+import os
+import re
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, List, Optional
+
+import jieba
+
+JIEBA_CACHE = os.environ.get("AGGREGATOR_JIEBA_CACHE", "")
+CACHE_SIZE = int(os.environ.get("AGGREGATOR_TOKEN_CACHE", "50000"))
+# 待切分标题少于该数量时直接在当前进程处理：每个子进程都要加载词典（约 1s），小批量不划算
+PARALLEL_MIN = 10000
+
+_warmed = False
+_cache: "OrderedDict[str, tuple]" = OrderedDict()
+
+
+def clean_text(t: str) -> str:
+    return re.sub(r"[^\u4e00-\u9fa5a-zA-Z0-9]+", " ", t)
+
+
+def warm_up() -> None:
+    """加载 jieba 词典（幂等，也用作进程池 initializer）"""
+    global _warmed
+    if _warmed:
+        return
+    if JIEBA_CACHE:
+        jieba.dt.cache_file = JIEBA_CACHE
+    jieba.initialize()
+    _warmed = True
+
+
+def _segment(text: str) -> tuple:
+    warm_up()
+    return tuple(jieba.lcut(text))
+
+
+def _remember(text: str, tokens: tuple) -> None:
+    _cache[text] = tokens
+    if len(_cache) > CACHE_SIZE:
+        _cache.popitem(last=False)
+
+
+def tokenize(text: str) -> List[str]:
+    """切分已清洗的文本（clean_text 的输出），结果按文本缓存"""
+    tokens = _cache.get(text)
+    if tokens is None:
+        tokens = _segment(text)
+        _remember(text, tokens)
+    else:
+        _cache.move_to_end(text)
+    return list(tokens)
+
+
+def tokenize_title(title: str) -> List[str]:
+    return tokenize(clean_text(title))
+
+
+def tokenize_many(texts: Iterable[str], workers: Optional[int] = None) -> List[List[str]]:
+    """
+    批量切分已清洗的文本
+    去重后未命中缓存的文本达到 PARALLEL_MIN 条且 workers > 1 时分发到进程池；
+    本批结果先保存在局部字典中组装返回值，之后才写回缓存，
+    未命中数超过 CACHE_SIZE 时也不会因淘汰而重复切分
+    """
+    texts = list(texts)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    missing = [t for t in dict.fromkeys(texts) if t not in _cache]
+    if workers > 1 and len(missing) >= PARALLEL_MIN:
+        chunksize = max(1, len(missing) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers, initializer=warm_up) as pool:
+            segmented = dict(zip(missing, pool.map(_segment, missing, chunksize=chunksize)))
+    else:
+        segmented = {text: _segment(text) for text in missing}
+
+    batch = {}
+    for text in dict.fromkeys(texts):
+        tokens = segmented.get(text)
+        if tokens is None:
+            tokens = _cache[text]
+            _cache.move_to_end(text)
+        batch[text] = tokens
+    for text, tokens in segmented.items():
+        _remember(text, tokens)
+    return [list(batch[t]) for t in texts]
@@ -1,10 +1,11 @@
-import requests
 from datetime import datetime
 
+from .http_client import get_json
+
 def fetch_zhihu_hot():
     """知乎热榜"""
     try:
-        resp = requests.get("https://www.zhihu.com/api/v4/hotlist/sections/total", timeout=10).json()
+        resp = get_json("https://www.zhihu.com/api/v4/hotlist/sections/total")
         return [
             {
                 "title": item["target"]["title_area"]["text"],
@@ -20,7 +21,7 @@ def fetch_zhihu_hot():
 def fetch_weibo_hot():
     """微博热搜"""
     try:
-        resp = requests.get("https://weibo.com/ajax/side/hotSearch", timeout=10).json()
+        resp = get_json("https://weibo.com/ajax/side/hotSearch")
         return [
             {
                 "title": item["word"],
@@ -36,7 +37,7 @@ def fetch_weibo_hot():
 def fetch_baidu_hot():
     """百度热榜"""
     try:
-        resp = requests.get("https://top.baidu.com/api/board?platform=pc&tab=realtime", timeout=10).json()
+        resp = get_json("https://top.baidu.com/api/board?platform=pc&tab=realtime")
         return [
             {
                 "title": item["word"],
@@ -52,7 +53,7 @@ def fetch_baidu_hot():
 def fetch_toutiao_hot():
     """今日头条热榜"""
     try:
-        resp = requests.get("https://www.toutiao.com/hot-event/hot-board/", timeout=10).json()
+        resp = get_json("https://www.toutiao.com/hot-event/hot-board/")
         return [
             {
                 "title": item["Title"],
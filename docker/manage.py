@@ -4,6 +4,7 @@
 新闻爬虫容器管理工具 - supercronic
 """
 
+import json
 import os
 import sys
 import subprocess
@@ -118,8 +119,82 @@ def parse_cron_schedule(cron_expr):
         return f"解析失败: {cron_expr}"
 
 
+def get_daemon_status_file():
+    """读取常驻模式状态文件路径（config.yaml 中 daemon.status_file）"""
+    status_file = "output/.daemon_status.json"
+    try:
+        import yaml
+
+        config_path = os.environ.get("CONFIG_PATH", "/app/config/config.yaml")
+        with open(config_path, "r", encoding="utf-8") as f:
+            daemon_config = (yaml.safe_load(f) or {}).get("daemon") or {}
+        status_file = daemon_config.get("status_file") or status_file
+    except Exception:
+        pass
+    return Path("/app") / status_file
+
+
+def show_daemon_status():
+    """显示常驻调度模式状态"""
+    print("📊 容器状态（常驻调度模式）:")
+
+    try:
+        with open('/proc/1/cmdline', 'r') as f:
+            pid1_cmdline = f.read().replace('\x00', ' ').strip()
+        print(f"  🔍 PID 1 进程: {pid1_cmdline}")
+        if "--daemon" in pid1_cmdline:
+            print("  ✅ main.py --daemon 正确运行为 PID 1")
+        else:
+            print("  ❌ PID 1 不是常驻调度进程")
+    except Exception as e:
+        print(f"  ❌ 无法读取 PID 1 信息: {e}")
+
+    status_file = get_daemon_status_file()
+    if not status_file.exists():
+        print(f"  ⏳ 状态文件尚未生成: {status_file}")
+        return
+
+    try:
+        with open(status_file, "r", encoding="utf-8") as f:
+            status = json.load(f)
+    except Exception as e:
+        print(f"  ❌ 读取状态文件失败: {e}")
+        return
+
+    state_names = {
+        "starting": "启动中",
+        "running": "执行中",
+        "idle": "等待下一轮",
+        "stopped": "已停止",
+    }
+    print("  ⚙️ 调度信息:")
+    print(f"    进程 PID: {status.get('pid')}")
+    print(f"    当前状态: {state_names.get(status.get('state'), status.get('state'))}")
+    print(f"    启动时间: {status.get('started_at')}")
+    print(f"    抓取间隔: {status.get('interval')} 秒")
+    if status.get("source_intervals"):
+        print(f"    按平台调度: {status.get('source_intervals')}")
+    print(f"    已执行轮数: {status.get('runs')}（失败 {status.get('failures')} 次）")
+    print(f"    上次开始: {status.get('last_run_started')}")
+    print(f"    上次结束: {status.get('last_run_finished')}")
+    if status.get("last_duration") is not None:
+        print(f"    上次耗时: {status.get('last_duration')} 秒")
+    if status.get("next_run_at"):
+        print(f"    下次执行: {status.get('next_run_at')}")
+    if status.get("last_error"):
+        print(f"    ❌ 上次错误: {status.get('last_error')}")
+
+    print("  📋 运行状态检查:")
+    print("    • 查看完整容器日志: docker logs trend-radar")
+    print("    • 停止后状态会显示为已停止: docker stop trend-radar")
+
+
 def show_status():
     """显示容器状态"""
+    if os.environ.get("RUN_MODE") == "daemon":
+        show_daemon_status()
+        return
+
     print("📊 容器状态:")
 
     # 检查 PID 1 状态
@@ -401,7 +476,7 @@ def show_help():
 
 📋 命令列表:
   run         - 手动执行一次爬虫
-  status      - 显示容器运行状态
+  status      - 显示容器运行状态（RUN_MODE=daemon 时显示常驻调度状态）
   config      - 显示当前配置
   files       - 显示输出文件
   logs        - 实时查看日志
@@ -1,28 +1,53 @@
 # coding=utf-8
 
+import gzip
+import hashlib
+import hmac
 import json
 import os
 import random
 import re
+import shutil
+import signal
+import struct
+import sys
 import time
 import webbrowser
 import argparse
+import atexit
+import queue
+import threading
+from array import array
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime
+from email.utils import formatdate, parsedate_to_datetime
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Union
+from typing import Dict, Iterator, List, Tuple, Optional, Union
+from urllib.parse import urlparse
 
 import pytz
 import requests
 import yaml
+from requests.adapters import HTTPAdapter
 
 # API 功能为可选依赖，尝试导入 Flask
 try:
-    from flask import Flask, jsonify, send_from_directory
+    from flask import Flask, Response, jsonify, request, send_from_directory
 
     FLASK_AVAILABLE = True
 except ImportError:
     FLASK_AVAILABLE = False
 
+# 批量权重计算使用 NumPy，未安装时逐条计算
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 # 截图功能为可选依赖，尝试导入 Playwright
 try:
     from playwright.sync_api import sync_playwright
@@ -31,6 +56,14 @@ try:
 except ImportError:
     PLAYWRIGHT_AVAILABLE = False
 
+# 快照文件的跨进程锁依赖 fcntl（Windows 上只做进程内互斥）
+try:
+    import fcntl
+
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
 
 VERSION = "2.2.0"
 
@@ -54,6 +87,9 @@ def load_config():
         "VERSION_CHECK_URL": config_data["app"]["version_check_url"],
         "SHOW_VERSION_UPDATE": config_data["app"]["show_version_update"],
         "REQUEST_INTERVAL": config_data["crawler"]["request_interval"],
+        "MAX_WORKERS": config_data["crawler"].get("max_workers", 4),
+        "USE_RESPONSE_CACHE": config_data["crawler"].get("response_cache", True),
+        "TXT_EXPORT": config_data.get("storage", {}).get("txt_export", True),
         "REPORT_MODE": config_data["report"]["mode"],
         "RANK_THRESHOLD": config_data["report"]["rank_threshold"],
         "USE_PROXY": config_data["crawler"]["use_proxy"],
@@ -92,6 +128,31 @@ def load_config():
             "HOTNESS_WEIGHT": config_data["weight"]["hotness_weight"],
         },
         "PLATFORMS": config_data["platforms"],
+        "DAEMON": {
+            "INTERVAL": config_data.get("daemon", {}).get("interval", 1800),
+            "SOURCE_INTERVALS": config_data.get("daemon", {}).get("source_intervals")
+            or {},
+            "STATUS_FILE": config_data.get("daemon", {}).get(
+                "status_file", "output/.daemon_status.json"
+            ),
+        },
+        "API": {
+            "REFRESH_INTERVAL": config_data.get("api", {}).get(
+                "refresh_interval", 1800
+            ),
+            "MIN_REFRESH_INTERVAL": config_data.get("api", {}).get(
+                "min_refresh_interval", 300
+            ),
+            "REFRESH_TOKEN": os.environ.get("API_REFRESH_TOKEN", "").strip()
+            or config_data.get("api", {}).get("refresh_token", ""),
+        },
+        "HTTP": {
+            "TIMEOUT": config_data.get("http", {}).get("timeout", 10),
+            "WEBHOOK_TIMEOUT": config_data.get("http", {}).get("webhook_timeout", 30),
+            "POOL_MAXSIZE": config_data.get("http", {}).get("pool_maxsize", 10),
+            "HOST_POOL_SIZES": config_data.get("http", {}).get("host_pool_sizes")
+            or {},
+        },
     }
 
     # Webhook配置（环境变量优先）
@@ -146,36 +207,248 @@ print(f"TrendRadar v{VERSION} 配置加载完成")
 print(f"监控平台数量: {len(CONFIG['PLATFORMS'])}")
 
 
+# === HTTP 客户端 ===
+class HttpClient:
+    """共享的 HTTP 客户端：连接池复用、按主机设置连接数、统一代理与超时"""
+
+    def __init__(self, http_config: Dict):
+        self.timeout = http_config["TIMEOUT"]
+        self.proxy_url = None
+        self.session = requests.Session()
+        self.adapters = []
+
+        default_adapter = self._make_adapter(http_config["POOL_MAXSIZE"])
+        self.session.mount("http://", default_adapter)
+        self.session.mount("https://", default_adapter)
+
+        for host, pool_size in http_config["HOST_POOL_SIZES"].items():
+            host_adapter = self._make_adapter(pool_size)
+            self.session.mount(f"http://{host}/", host_adapter)
+            self.session.mount(f"https://{host}/", host_adapter)
+
+    def _make_adapter(self, pool_maxsize: int) -> HTTPAdapter:
+        """创建连接池适配器"""
+        adapter = HTTPAdapter(pool_maxsize=pool_maxsize, pool_block=False)
+        self.adapters.append(adapter)
+        return adapter
+
+    def set_proxy(self, proxy_url: Optional[str]) -> None:
+        """设置默认代理"""
+        self.proxy_url = proxy_url or None
+
+    def request(
+            self,
+            method: str,
+            url: str,
+            proxy_url: Optional[str] = None,
+            timeout: Optional[float] = None,
+            **kwargs,
+    ) -> requests.Response:
+        """发送请求，未指定代理和超时时使用客户端默认配置"""
+        proxy_url = proxy_url or self.proxy_url
+        proxies = {"http": proxy_url, "https": proxy_url} if proxy_url else None
+        return self.session.request(
+            method,
+            url,
+            proxies=proxies,
+            timeout=timeout if timeout is not None else self.timeout,
+            **kwargs,
+        )
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def connection_stats(self) -> Dict[str, int]:
+        """统计新建与复用的连接数"""
+        pools = []
+        for adapter in self.adapters:
+            managers = [adapter.poolmanager, *adapter.proxy_manager.values()]
+            for manager in managers:
+                pools.extend(manager.pools[key] for key in manager.pools.keys())
+
+        new_connections = sum(pool.num_connections for pool in pools)
+        total_requests = sum(pool.num_requests for pool in pools)
+        return {
+            "requests": total_requests,
+            "new": new_connections,
+            "reused": max(0, total_requests - new_connections),
+        }
+
+    def log_connection_stats(self) -> None:
+        """打印连接复用情况"""
+        stats = self.connection_stats()
+        print(
+            f"HTTP 连接统计: 请求 {stats['requests']} 次，新建连接 {stats['new']} 个，复用 {stats['reused']} 次"
+        )
+
+
+HTTP_CLIENT = HttpClient(CONFIG["HTTP"])
+
+
 # === 新增功能：网页截图 ===
-def generate_image_from_html(html_file_path: str, output_image_path: str):
+class ScreenshotService:
+    """常驻的无头浏览器截图服务
+
+    浏览器在首次截图时启动，之后一直复用同一个浏览器和页面，避免每次冷启动 Chromium。
+    Playwright 的同步 API 只能在创建它的线程中使用，因此所有截图由一个后台线程串行完成；
+    submit 立即返回 Future，不阻塞 JSON 生成。队列中同一输出路径的多个任务只截最新的一次。
     """
-    使用 Playwright 渲染 HTML 文件并截取指定元素的图片。
+
+    VIEWPORT = {"width": 650, "height": 1080}
+
+    def __init__(self):
+        self._jobs = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+        self._playwright = None
+        self._browser = None
+        self._page = None
+        atexit.register(self.close)
+
+    def submit(
+            self, html: str, output_image_path: str, base_url: Optional[str] = None
+    ) -> Future:
+        """
+        提交截图任务（HTML 字符串），结果为是否成功
+        base_url 为页面中相对路径的解析基准（通常是报告文件所在目录的 file:// URL）
+        """
+        future = Future()
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="screenshot", daemon=True
+                )
+                self._thread.start()
+            self._jobs.put((html, base_url, output_image_path, future))
+        return future
+
+    def close(self) -> None:
+        """处理完已提交的任务后关闭浏览器"""
+        with self._lock:
+            thread = self._thread
+            if thread is None or not thread.is_alive():
+                return
+            self._jobs.put(None)
+        thread.join()
+
+    def _run(self) -> None:
+        try:
+            while True:
+                job = self._jobs.get()
+                if job is None:
+                    return
+                # 合并排队中的任务：同一路径只保留最新 HTML
+                html, base_url, path, future = job
+                jobs = {path: (html, base_url, [future])}
+                stop = False
+                while True:
+                    try:
+                        job = self._jobs.get_nowait()
+                    except queue.Empty:
+                        break
+                    if job is None:
+                        stop = True
+                        break
+                    html, base_url, path, future = job
+                    futures = jobs.pop(path, (None, None, []))[2]
+                    jobs[path] = (html, base_url, futures + [future])
+
+                for path, (html, base_url, futures) in jobs.items():
+                    ok = self._capture(html, path, base_url)
+                    for future in futures:
+                        future.set_result(ok)
+                if stop:
+                    return
+        finally:
+            self._shutdown()
+
+    def _ensure_page(self):
+        if self._page is None or self._page.is_closed():
+            if self._browser is None or not self._browser.is_connected():
+                self._shutdown()
+                self._playwright = sync_playwright().start()
+                self._browser = self._playwright.chromium.launch()
+            self._page = self._browser.new_page(viewport=self.VIEWPORT)
+        return self._page
+
+    def _capture(
+            self, html: str, output_image_path: str, base_url: Optional[str] = None
+    ) -> bool:
+        print(f"正在生成图片: {output_image_path}")
+        try:
+            output_path = Path(output_image_path)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+
+            page = self._ensure_page()
+            if base_url:
+                # set_content 后页面地址为 about:blank，用 <base> 保持与打开文件时相同的相对路径解析
+                html = html.replace(
+                    "<head>", f'<head><base href="{html_escape(base_url)}">', 1
+                )
+            page.set_content(html)
+            # 截取包含热点新闻分析的 .container 元素
+            element = page.query_selector(".container")
+            if not element:
+                print("错误: 在HTML报告中未找到 '.container' 元素，无法截图。")
+                return False
+
+            image_type = "png" if output_path.suffix.lower() == ".png" else "jpeg"
+            data = element.screenshot(type=image_type)
+            tmp_path = output_path.with_name(output_path.name + ".tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, output_path)
+            print(f"图片成功保存至: {output_image_path}")
+            return True
+        except Exception as e:
+            print(f"生成图片时发生错误: {e}")
+            print("请确保 Playwright 已正确安装 ('pip install playwright' 和 'playwright install')。")
+            # 浏览器可能已失效，下次截图时重新启动
+            self._shutdown()
+            return False
+
+    def _shutdown(self) -> None:
+        for close in (
+            lambda: self._browser and self._browser.close(),
+            lambda: self._playwright and self._playwright.stop(),
+        ):
+            try:
+                close()
+            except Exception:
+                pass
+        self._page = None
+        self._browser = None
+        self._playwright = None
+
+
+SCREENSHOTS = ScreenshotService()
+
+
+def generate_image_from_html(
+        html_file_path: str,
+        output_image_path: str,
+        wait: bool = True,
+        html: Optional[str] = None,
+) -> Optional[Future]:
+    """
+    截取 HTML 报告中的 .container 元素保存为图片
+    html 为调用方已渲染好的报告内容，传入时不再读回文件
+    wait=False 时立即返回 Future，截图在后台完成（进程退出前会处理完已提交的截图）
     """
     if not PLAYWRIGHT_AVAILABLE:
         print("Playwright 模块未安装，无法生成图片。请运行 'pip install playwright'。")
-        return
+        return None
 
-    print(f"正在从 {html_file_path} 生成图片...")
-    try:
-        output_dir = Path(output_image_path).parent
-        output_dir.mkdir(parents=True, exist_ok=True)
-
-        with sync_playwright() as p:
-            browser = p.chromium.launch()
-            page = browser.new_page(viewport={"width": 650, "height": 1080})
-            uri = Path(html_file_path).resolve().as_uri()
-            page.goto(uri)
-            # 截取包含热点新闻分析的 .container 元素
-            element = page.query_selector('.container')
-            if element:
-                element.screenshot(path=output_image_path)
-                print(f"图片成功保存至: {output_image_path}")
-            else:
-                print("错误: 在HTML报告中未找到 '.container' 元素，无法截图。")
-            browser.close()
-    except Exception as e:
-        print(f"生成图片时发生错误: {e}")
-        print("请确保 Playwright 已正确安装 ('pip install playwright' 和 'playwright install')。")
+    report_path = Path(html_file_path).resolve()
+    if html is None:
+        html = report_path.read_text(encoding="utf-8")
+    base_url = report_path.parent.as_uri() + "/"
+    future = SCREENSHOTS.submit(html, output_image_path, base_url)
+    if wait:
+        future.result()
+    return future
 
 
 # === 工具函数 ===
@@ -222,19 +495,13 @@ def check_version_update(
 ) -> Tuple[bool, Optional[str]]:
     """检查版本更新"""
     try:
-        proxies = None
-        if proxy_url:
-            proxies = {"http": proxy_url, "https": proxy_url}
-
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
             "Accept": "text/plain, */*",
             "Cache-Control": "no-cache",
         }
 
-        response = requests.get(
-            version_url, proxies=proxies, headers=headers, timeout=10
-        )
+        response = HTTP_CLIENT.get(version_url, proxy_url=proxy_url, headers=headers)
         response.raise_for_status()
 
         remote_version = response.text.strip()
@@ -263,9 +530,11 @@ def check_version_update(
 
 def is_first_crawl_today() -> bool:
     """检测是否是当天第一次爬取"""
-    date_folder = format_date_folder()
-    txt_dir = Path("output") / date_folder / "txt"
+    store = SnapshotStore()
+    if store.exists():
+        return len(DayState.today().times) <= 1
 
+    txt_dir = store.path.parent / "txt"
     if not txt_dir.exists():
         return True
 
@@ -363,11 +632,120 @@ class PushRecordManager:
 
 
 # === 数据获取 ===
+class HostThrottle:
+    """按主机控制请求节奏：同一主机相邻两次请求的发起间隔不小于 request_interval"""
+
+    def __init__(self, request_interval: int):
+        self.request_interval = request_interval
+        self._next_slot = {}
+        self._lock = threading.Lock()
+
+    def wait(self, host: str) -> None:
+        """阻塞直到该主机允许发起下一次请求"""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            actual_interval = self.request_interval + random.randint(-10, 20)
+            actual_interval = max(50, actual_interval)
+            self._next_slot[host] = slot + actual_interval / 1000
+
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+class ResponseCache:
+    """接口响应缓存：按平台ID保存 ETag/Last-Modified、内容摘要和解析结果
+
+    本轮抓取的更新先暂存，save 时才生效并写盘。调用方应在快照落盘后再 save，
+    否则快照未保存时下一轮会因 304 或摘要一致把平台当作未变化，标题永远不会被记为新增。
+    """
+
+    def __init__(self, cache_file: Optional[Path] = None):
+        self.cache_file = cache_file or Path("output") / ".http_cache" / "newsnow.json"
+        self._lock = threading.Lock()
+        self._entries = self._load()
+        self._pending = {}
+
+    def _load(self) -> Dict:
+        """读取缓存文件，损坏时忽略"""
+        if not self.cache_file.exists():
+            return {}
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"读取响应缓存失败: {e}")
+            return {}
+
+    def get(self, id_value: str) -> Optional[Dict]:
+        """获取平台的缓存条目"""
+        with self._lock:
+            return self._entries.get(id_value)
+
+    def update(
+            self,
+            id_value: str,
+            etag: str,
+            last_modified: str,
+            digest: str,
+            titles: Dict,
+    ) -> None:
+        """暂存平台的缓存条目，save 时生效"""
+        with self._lock:
+            self._pending[id_value] = {
+                "etag": etag,
+                "last_modified": last_modified,
+                "digest": digest,
+                "date": format_date_folder(),
+                "titles": titles,
+            }
+
+    def touch(self, id_value: str) -> None:
+        """内容未变化时刷新条目日期（同样暂存到 save）"""
+        with self._lock:
+            entry = self._pending.get(id_value) or self._entries.get(id_value)
+            if entry is not None:
+                self._pending[id_value] = {**entry, "date": format_date_folder()}
+
+    def save(self) -> None:
+        """暂存的更新生效并写回缓存文件"""
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with self._lock:
+                self._entries.update(self._pending)
+                self._pending = {}
+                content = json.dumps(self._entries, ensure_ascii=False)
+            with open(self.cache_file, "w", encoding="utf-8") as f:
+                f.write(content)
+        except Exception as e:
+            print(f"保存响应缓存失败: {e}")
+
+
 class DataFetcher:
     """数据获取器"""
 
+    API_URL_TEMPLATE = "https://newsnow.busiyi.world/api/s?id={}&latest"
+
     def __init__(self, proxy_url: Optional[str] = None):
         self.proxy_url = proxy_url
+        self.response_cache = (
+            ResponseCache() if CONFIG["USE_RESPONSE_CACHE"] else None
+        )
+        # 本轮不到抓取时间的平台（常驻模式按平台调度），直接复用当天的缓存标题
+        self.deferred_ids = set()
+        # 最近一次 crawl_websites 中内容与当日上次抓取相同的平台
+        self.unchanged_ids = set()
+        self._validators = {}
+
+    def save_response_cache(self) -> None:
+        """快照落盘后保存本轮的响应缓存更新"""
+        if self.response_cache is not None:
+            self.response_cache.save()
+
+    def build_url(self, id_value: str) -> str:
+        """构建数据源请求地址"""
+        return self.API_URL_TEMPLATE.format(id_value)
 
     def fetch_data(
             self,
@@ -375,19 +753,20 @@ class DataFetcher:
             max_retries: int = 2,
             min_retry_wait: int = 3,
             max_retry_wait: int = 5,
+            cache_entry: Optional[Dict] = None,
     ) -> Tuple[Optional[str], str, str]:
-        """获取指定ID数据，支持重试"""
+        """获取指定ID数据，支持重试
+
+        传入 cache_entry 时发送条件请求；若服务端返回 304 或内容摘要与缓存一致，
+        则不解析响应，返回 (None, id, alias) 并将 ID 记入 unchanged_ids
+        """
         if isinstance(id_info, tuple):
             id_value, alias = id_info
         else:
             id_value = id_info
             alias = id_value
 
-        url = f"https://newsnow.busiyi.world/api/s?id={id_value}&latest"
-
-        proxies = None
-        if self.proxy_url:
-            proxies = {"http": self.proxy_url, "https": self.proxy_url}
+        url = self.build_url(id_value)
 
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
@@ -396,15 +775,30 @@ class DataFetcher:
             "Connection": "keep-alive",
             "Cache-Control": "no-cache",
         }
+        if cache_entry:
+            if cache_entry.get("etag"):
+                headers["If-None-Match"] = cache_entry["etag"]
+            if cache_entry.get("last_modified"):
+                headers["If-Modified-Since"] = cache_entry["last_modified"]
 
         retries = 0
         while retries <= max_retries:
             try:
-                response = requests.get(
-                    url, proxies=proxies, headers=headers, timeout=10
+                response = HTTP_CLIENT.get(
+                    url, proxy_url=self.proxy_url, headers=headers
                 )
+                if cache_entry and response.status_code == 304:
+                    print(f"获取 {id_value} 成功（内容未变化）")
+                    self.unchanged_ids.add(id_value)
+                    return None, id_value, alias
                 response.raise_for_status()
 
+                digest = hashlib.sha1(response.content).hexdigest()
+                if cache_entry and cache_entry.get("digest") == digest:
+                    print(f"获取 {id_value} 成功（内容未变化）")
+                    self.unchanged_ids.add(id_value)
+                    return None, id_value, alias
+
                 data_text = response.text
                 data_json = json.loads(data_text)
 
@@ -414,6 +808,11 @@ class DataFetcher:
 
                 status_info = "最新数据" if status == "success" else "缓存数据"
                 print(f"获取 {id_value} 成功（{status_info}）")
+                self._validators[id_value] = (
+                    response.headers.get("ETag", ""),
+                    response.headers.get("Last-Modified", ""),
+                    digest,
+                )
                 return data_text, id_value, alias
 
             except Exception as e:
@@ -429,17 +828,95 @@ class DataFetcher:
                     return None, id_value, alias
         return None, id_value, alias
 
+    def parse_items(self, response: str) -> Dict:
+        """将接口响应解析为 {标题: {ranks, url, mobileUrl}}"""
+        data = json.loads(response)
+        titles = {}
+        for index, item in enumerate(data.get("items", []), 1):
+            title = item["title"]
+            url = item.get("url", "")
+            mobile_url = item.get("mobileUrl", "")
+
+            if title in titles:
+                titles[title]["ranks"].append(index)
+            else:
+                titles[title] = {
+                    "ranks": [index],
+                    "url": url,
+                    "mobileUrl": mobile_url,
+                }
+        return titles
+
+    def _crawl_one(
+            self, id_info: Union[str, Tuple[str, str]], throttle: HostThrottle
+    ) -> Optional[Dict]:
+        """爬取并解析单个数据源，失败返回 None"""
+        id_value = id_info[0] if isinstance(id_info, tuple) else id_info
+
+        cache_entry = None
+        if self.response_cache is not None:
+            cache_entry = self.response_cache.get(id_value)
+
+        if (
+                id_value in self.deferred_ids
+                and cache_entry
+                and cache_entry.get("date") == format_date_folder()
+        ):
+            self.unchanged_ids.add(id_value)
+            return cache_entry["titles"]
+
+        throttle.wait(urlparse(self.build_url(id_value)).netloc)
+        response, _, _ = self.fetch_data(id_info, cache_entry=cache_entry)
+
+        if id_value in self.unchanged_ids:
+            # 仅当缓存来自当天的抓取时，才能认定本批次没有新增标题
+            if cache_entry.get("date") != format_date_folder():
+                self.unchanged_ids.discard(id_value)
+            self.response_cache.touch(id_value)
+            return cache_entry["titles"]
+
+        if not response:
+            return None
+
+        try:
+            titles = self.parse_items(response)
+            if self.response_cache is not None:
+                etag, last_modified, digest = self._validators.pop(id_value)
+                self.response_cache.update(
+                    id_value, etag, last_modified, digest, titles
+                )
+            return titles
+        except json.JSONDecodeError:
+            print(f"解析 {id_value} 响应失败")
+        except Exception as e:
+            print(f"处理 {id_value} 数据出错: {e}")
+        return None
+
     def crawl_websites(
             self,
             ids_list: List[Union[str, Tuple[str, str]]],
             request_interval: int = CONFIG["REQUEST_INTERVAL"],
+            max_workers: int = CONFIG["MAX_WORKERS"],
     ) -> Tuple[Dict, Dict, List]:
-        """爬取多个网站数据"""
+        """并发爬取多个网站数据，请求间隔按主机生效，结果顺序与 ids_list 一致"""
         results = {}
         id_to_name = {}
         failed_ids = []
 
-        for i, id_info in enumerate(ids_list):
+        if not ids_list:
+            return results, id_to_name, failed_ids
+
+        self.unchanged_ids = set()
+        throttle = HostThrottle(request_interval)
+        workers = max(1, min(max_workers, len(ids_list)))
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self._crawl_one, id_info, throttle)
+                for id_info in ids_list
+            ]
+
+        for id_info, future in zip(ids_list, futures):
             if isinstance(id_info, tuple):
                 id_value, name = id_info
             else:
@@ -447,47 +924,597 @@ class DataFetcher:
                 name = id_value
 
             id_to_name[id_value] = name
-            response, _, _ = self.fetch_data(id_info)
-
-            if response:
-                try:
-                    data = json.loads(response)
-                    results[id_value] = {}
-                    for index, item in enumerate(data.get("items", []), 1):
-                        title = item["title"]
-                        url = item.get("url", "")
-                        mobile_url = item.get("mobileUrl", "")
-
-                        if title in results[id_value]:
-                            results[id_value][title]["ranks"].append(index)
-                        else:
-                            results[id_value][title] = {
-                                "ranks": [index],
-                                "url": url,
-                                "mobileUrl": mobile_url,
-                            }
-                except json.JSONDecodeError:
-                    print(f"解析 {id_value} 响应失败")
-                    failed_ids.append(id_value)
-                except Exception as e:
-                    print(f"处理 {id_value} 数据出错: {e}")
-                    failed_ids.append(id_value)
+            title_data = future.result()
+
+            if title_data is not None:
+                results[id_value] = title_data
             else:
                 failed_ids.append(id_value)
 
-            if i < len(ids_list) - 1:
-                actual_interval = request_interval + random.randint(-10, 20)
-                actual_interval = max(50, actual_interval)
-                time.sleep(actual_interval / 1000)
-
         print(f"成功: {list(results.keys())}, 失败: {failed_ids}")
+        if self.deferred_ids:
+            print(f"未到抓取时间（复用缓存）: {sorted(self.deferred_ids & set(results))}")
+        if self.unchanged_ids:
+            print(f"内容未变化: {sorted(self.unchanged_ids)}")
         return results, id_to_name, failed_ids
 
 
+# === 快照存储 ===
+class SnapshotStore:
+    """当日抓取快照的追加式二进制存储
+
+    文件由若干记录组成，每条记录为 1 字节类型 + 4 字节长度 + 负载：
+      S 记录：追加字符串表（\0 分隔；标题、URL、平台ID等只存一次，之后按序号引用）
+      T 记录：一次抓取快照，每个平台的标题保存为 (标题, 排名, URL, 移动端URL) 整数数组
+    同一时间（HH时MM分）的快照以最后一条为准，与 txt 文件同名覆盖的行为一致。
+    """
+
+    FILE_NAME = "snapshots.bin"
+    LOCK_NAME = "snapshots.lock"
+    _RECORD_HEAD = struct.Struct("<cI")
+    _U32 = struct.Struct("<I")
+    # 锁文件路径 -> [进程内可重入锁, 持有深度, 已加 flock 的文件]
+    _locks = {}
+    _locks_guard = threading.Lock()
+
+    def __init__(self, date_folder: Optional[str] = None):
+        self.date_folder = date_folder or format_date_folder()
+        self.path = Path("output") / self.date_folder / self.FILE_NAME
+        self._forget()
+
+    def _forget(self) -> None:
+        """清空已读取的字符串表"""
+        self._strings = []
+        self._string_ids = {}
+        self._string_records = []
+        # [0, _end) 内的记录均已解析，其中的字符串表已读入内存
+        self._end = 0
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    @contextmanager
+    def locked(self) -> Iterator[None]:
+        """
+        持有当日快照的排他锁：跨进程用 flock，同一进程内可重入
+        追加快照、合并当日状态都在锁内完成，其他进程（如 API 刷新与定时任务）
+        不会在读取结尾与写入之间插入记录
+        """
+        lock_path = self.path.parent / self.LOCK_NAME
+        with self._locks_guard:
+            entry = self._locks.setdefault(str(lock_path), [threading.RLock(), 0, None])
+
+        with entry[0]:
+            if entry[1] == 0:
+                lock_path.parent.mkdir(parents=True, exist_ok=True)
+                lock_file = open(lock_path, "a")
+                if FCNTL_AVAILABLE:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX)
+                entry[2] = lock_file
+            entry[1] += 1
+            try:
+                yield
+            finally:
+                entry[1] -= 1
+                if entry[1] == 0:
+                    # 关闭文件即释放 flock
+                    entry[2].close()
+                    entry[2] = None
+
+    def _scan(self, offset: int = 0) -> Tuple[List[Tuple[int, memoryview]], int]:
+        """读取尚未解析的记录并补齐字符串表
+
+        返回 ([(偏移, 快照负载)]（仅 offset 之后的快照）, 有效数据结尾偏移)。
+        只从 min(offset, 已解析位置) 起读取文件，已读入的字符串表记录不会重复解码。
+        """
+        if not self.path.exists():
+            self._forget()
+            return [], 0
+        if self.path.stat().st_size < self._end:
+            # 文件被截断或替换，重新读取
+            self._forget()
+
+        start = min(offset, self._end)
+        with open(self.path, "rb") as f:
+            f.seek(start)
+            data = memoryview(f.read())
+
+        snapshots = []
+        pos = 0
+        head_size = self._RECORD_HEAD.size
+        while pos + head_size <= len(data):
+            kind, length = self._RECORD_HEAD.unpack_from(data, pos)
+            begin = pos + head_size
+            if begin + length > len(data):
+                # 末尾记录不完整（写入中断），忽略
+                break
+            record_offset = start + pos
+            payload = data[begin:begin + length]
+            if kind == b"S" and record_offset >= self._end:
+                self._add_strings(self._decode_strings(payload), record_offset, length)
+            elif kind == b"T" and record_offset >= offset:
+                snapshots.append((record_offset, payload))
+            pos = begin + length
+
+        self._end = start + pos
+        return snapshots, self._end
+
+    def string_records(self, end: int) -> List[List[int]]:
+        """返回 end 之前的字符串表记录位置 [[偏移, 长度]]，用于持久化"""
+        return [record for record in self._string_records if record[0] < end]
+
+    def restore(self, end: int, string_records: List[List[int]]) -> None:
+        """按持久化的记录位置恢复字符串表，只读取这些记录，之后从 end 继续解析"""
+        if self.path.stat().st_size < end:
+            raise ValueError("快照文件比状态记录的短")
+
+        strings = []
+        with open(self.path, "rb") as f:
+            for record_offset, length in string_records:
+                f.seek(record_offset)
+                head = f.read(self._RECORD_HEAD.size)
+                payload = f.read(length)
+                if (
+                        len(head) != self._RECORD_HEAD.size
+                        or self._RECORD_HEAD.unpack(head) != (b"S", length)
+                        or len(payload) != length
+                ):
+                    raise ValueError("快照文件与状态记录不一致")
+                strings.append((self._decode_strings(memoryview(payload)), record_offset, length))
+
+        self._forget()
+        for decoded, record_offset, length in strings:
+            self._add_strings(decoded, record_offset, length)
+        self._end = end
+
+    def _add_strings(self, strings: List[str], record_offset: int, length: int) -> None:
+        base = len(self._strings)
+        self._strings.extend(strings)
+        self._string_ids.update(zip(strings, range(base, base + len(strings))))
+        self._string_records.append([record_offset, length])
+
+    def _decode_strings(self, payload: memoryview) -> List[str]:
+        return bytes(payload).decode("utf-8").split("\x00")
+
+    def _decode_snapshot(
+            self, payload: memoryview, strings: List[str]
+    ) -> Tuple[str, Dict, Dict]:
+        """解码快照记录为 (time_info, titles_by_id, id_to_name)"""
+        ints = array("I")
+        ints.frombytes(bytes(payload))
+        if sys.byteorder != "little":
+            ints.byteswap()
+
+        time_info = strings[ints[0]]
+        source_count, failed_count = ints[1], ints[2]
+        pos = 3 + failed_count
+
+        titles_by_id = {}
+        id_to_name = {}
+        for _ in range(source_count):
+            source_id = strings[ints[pos]]
+            name = strings[ints[pos + 1]]
+            title_count = ints[pos + 2]
+            pos += 3
+
+            quads = ints[pos:pos + title_count * 4]
+            pos += title_count * 4
+            if not title_count:
+                continue
+
+            id_to_name[source_id] = name
+            titles_by_id[source_id] = {
+                strings[title_sid]: {
+                    "ranks": [rank],
+                    "url": strings[url_sid],
+                    "mobileUrl": strings[mobile_sid],
+                }
+                for title_sid, rank, url_sid, mobile_sid in zip(
+                    quads[0::4], quads[1::4], quads[2::4], quads[3::4]
+                )
+            }
+
+        return time_info, titles_by_id, id_to_name
+
+    def snapshot_times(self) -> List[str]:
+        """按抓取顺序返回去重后的快照时间"""
+        records, _ = self._scan()
+        strings = self._strings
+        times = {}
+        for _, payload in records:
+            (time_sid,) = self._U32.unpack_from(payload, 0)
+            times.pop(strings[time_sid], None)
+            times[strings[time_sid]] = True
+        return list(times)
+
+    def read_since(self, offset: int) -> Tuple[List[Tuple[str, Dict, Dict]], int]:
+        """读取从 offset 起追加的快照（不去重），返回 (快照列表, 有效数据结尾偏移)"""
+        records, valid_end = self._scan(offset)
+        snapshots = [
+            self._decode_snapshot(payload, self._strings) for _, payload in records
+        ]
+        return snapshots, valid_end
+
+    def read(self) -> List[Tuple[str, Dict, Dict]]:
+        """读取当日全部快照，按抓取顺序返回 [(time_info, titles_by_id, id_to_name)]"""
+        snapshots = {}
+        for snapshot in self.read_since(0)[0]:
+            snapshots.pop(snapshot[0], None)
+            snapshots[snapshot[0]] = snapshot
+        return list(snapshots.values())
+
+    def append(
+            self,
+            time_info: str,
+            results: Dict,
+            id_to_name: Dict,
+            failed_ids: List,
+    ) -> None:
+        """追加一次抓取快照（持有排他锁，读取结尾到写入之间不会有其他进程追加）"""
+        with self.locked():
+            self._append(time_info, results, id_to_name, failed_ids)
+
+    def _append(
+            self,
+            time_info: str,
+            results: Dict,
+            id_to_name: Dict,
+            failed_ids: List,
+    ) -> None:
+        if not self.path.exists():
+            self._import_txt_files()
+
+        # 只读取其他进程追加、尚未解析的部分
+        _, valid_end = self._scan(self._end)
+        string_ids = self._string_ids
+        added_ids = {}
+        new_strings = []
+
+        def intern(value: str) -> int:
+            value = value.replace("\x00", "")
+            index = string_ids.get(value)
+            if index is None:
+                index = added_ids.get(value)
+            if index is None:
+                index = len(self._strings) + len(new_strings)
+                added_ids[value] = index
+                new_strings.append(value)
+            return index
+
+        ints = array("I", [intern(time_info), len(results), len(failed_ids)])
+        ints.extend(intern(id_value) for id_value in failed_ids)
+
+        for id_value, title_data in results.items():
+            sorted_titles = []
+            for title, info in title_data.items():
+                if isinstance(info, dict):
+                    ranks = info.get("ranks", [])
+                    url = info.get("url", "")
+                    mobile_url = info.get("mobileUrl", "")
+                else:
+                    ranks = info if isinstance(info, list) else []
+                    url = ""
+                    mobile_url = ""
+                rank = ranks[0] if ranks else 1
+                sorted_titles.append((rank, clean_title(title), url, mobile_url))
+            sorted_titles.sort(key=lambda x: x[0])
+
+            ints.extend(
+                (
+                    intern(id_value),
+                    intern(id_to_name.get(id_value) or id_value),
+                    len(sorted_titles),
+                )
+            )
+            for rank, title, url, mobile_url in sorted_titles:
+                ints.extend((intern(title), rank, intern(url), intern(mobile_url)))
+
+        if sys.byteorder != "little":
+            ints.byteswap()
+
+        chunks = []
+        if new_strings:
+            encoded = "\x00".join(new_strings).encode("utf-8")
+            chunks.append(self._RECORD_HEAD.pack(b"S", len(encoded)) + encoded)
+        snapshot_bytes = ints.tobytes()
+        chunks.append(self._RECORD_HEAD.pack(b"T", len(snapshot_bytes)) + snapshot_bytes)
+        data = b"".join(chunks)
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "ab") as f:
+            # 锁内 _scan 之后的字节只可能是上次中断写入留下的残缺记录，丢弃
+            if f.tell() > valid_end:
+                f.truncate(valid_end)
+            f.write(data)
+
+        # 写入成功后再更新内存中的字符串表
+        if new_strings:
+            self._add_strings(new_strings, valid_end, len(encoded))
+        self._end = valid_end + len(data)
+
+    def _import_txt_files(self) -> None:
+        """首次使用时导入当日已有的 txt 快照"""
+        txt_dir = self.path.parent / "txt"
+        if not txt_dir.exists():
+            return
+
+        files = sorted([f for f in txt_dir.iterdir() if f.suffix == ".txt"])
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.touch()
+        for file_path in files:
+            titles_by_id, file_id_to_name = parse_file_titles(file_path)
+            self.append(file_path.stem, titles_by_id, file_id_to_name, [])
+        if files:
+            print(f"已将 {len(files)} 个 txt 快照导入 {self.path}")
+
+
+class DayState:
+    """当日聚合状态：合并后的标题统计、最新批次及其新增标题
+
+    状态持久化在 output/<日期>/day_state.json，并记录已消费的快照文件偏移及其之前
+    字符串表记录的位置。新进程只读取这些字符串表记录和偏移之后追加的快照，
+    使单次运行的开销与当天已有快照数量无关。
+    每个标题的排序权重随排名合并一起更新，统计时直接读取。
+    """
+
+    FILE_NAME = "day_state.json"
+    VERSION = 3
+    _instances = {}
+
+    def __init__(self, date_folder: Optional[str] = None):
+        self.store = SnapshotStore(date_folder)
+        self.path = self.store.path.parent / self.FILE_NAME
+        self._reset()
+
+    def _reset(self) -> None:
+        self.store_offset = 0
+        self.times = []
+        self.id_to_name = {}
+        self.title_info = {}
+        self.latest_titles = {}
+        self.latest_new = {}
+
+    @classmethod
+    def current(cls) -> "DayState":
+        """获取当天的聚合状态（进程内复用），不合并新快照"""
+        date_folder = format_date_folder()
+        state = cls._instances.get(date_folder)
+        if state is None:
+            cls._instances.clear()
+            state = cls(date_folder)
+            state._load()
+            cls._instances[date_folder] = state
+        return state
+
+    @classmethod
+    def today(cls) -> "DayState":
+        """获取当天的聚合状态，并合并尚未处理的快照"""
+        state = cls.current()
+        state.sync()
+        return state
+
+    def _load(self) -> None:
+        """读取持久化的状态，版本不符或损坏时从头重建"""
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != self.VERSION:
+                return
+            self.store_offset = data["store_offset"]
+            self.times = data["times"]
+            self.id_to_name = data["id_to_name"]
+            self.title_info = data["title_info"]
+            self.latest_titles = data["latest_titles"]
+            self.latest_new = data["latest_new"]
+            self.store.restore(self.store_offset, data["store_strings"])
+            if data.get("weight_params") != self.weight_params():
+                # 权重配置有变化，按新配置重新计算已有标题的权重
+                self._update_weights(
+                    [
+                        info
+                        for source_info in self.title_info.values()
+                        for info in source_info.values()
+                    ]
+                )
+        except Exception as e:
+            print(f"读取当日状态失败，将重新构建: {e}")
+            self._reset()
+
+    @staticmethod
+    def weight_params() -> List:
+        """存储的权重所依赖的配置"""
+        weight_config = CONFIG["WEIGHT_CONFIG"]
+        return [
+            CONFIG["RANK_THRESHOLD"],
+            weight_config["RANK_WEIGHT"],
+            weight_config["FREQUENCY_WEIGHT"],
+            weight_config["HOTNESS_WEIGHT"],
+        ]
+
+    @staticmethod
+    def _update_weights(infos: List[Dict]) -> None:
+        for info, weight in zip(infos, calculate_news_weights(infos)):
+            info["weight"] = weight
+
+    def save(self) -> None:
+        """原子写入状态文件"""
+        data = {
+            "version": self.VERSION,
+            "weight_params": self.weight_params(),
+            "store_offset": self.store_offset,
+            "store_strings": self.store.string_records(self.store_offset),
+            "times": self.times,
+            "id_to_name": self.id_to_name,
+            "title_info": self.title_info,
+            "latest_titles": self.latest_titles,
+            "latest_new": self.latest_new,
+        }
+        tmp_path = self.path.with_suffix(".tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            print(f"保存当日状态失败: {e}")
+
+    def sync(self) -> None:
+        """合并快照文件中新追加的快照（与追加共用快照锁，day_state.json 也在锁内写入）"""
+        if not self.store.exists():
+            if self.times:
+                self._reset()
+            return
+
+        with self.store.locked():
+            self._sync()
+
+    def _sync(self) -> None:
+        size = self.store.path.stat().st_size
+        if size == self.store_offset:
+            return
+
+        if size < self.store_offset:
+            self._reset()
+
+        snapshots, valid_end = self.store.read_since(self.store_offset)
+        if valid_end == self.store_offset:
+            return
+
+        if any(snapshot[0] in self.times for snapshot in snapshots) or len(
+                {snapshot[0] for snapshot in snapshots}
+        ) < len(snapshots):
+            # 同一时间的快照被覆盖，无法增量合并，重新构建
+            self._reset()
+            snapshots = self.store.read()
+
+        for time_info, titles_by_id, file_id_to_name in snapshots:
+            self._apply(time_info, titles_by_id, file_id_to_name)
+
+        self.store_offset = valid_end
+        self.save()
+
+    def _apply(self, time_info: str, titles_by_id: Dict, file_id_to_name: Dict) -> None:
+        """合并一次快照，规则与 process_source_data 一致"""
+        self.id_to_name.update(file_id_to_name)
+        latest_new = {}
+        changed_infos = []
+
+        for source_id, title_data in titles_by_id.items():
+            source_info = self.title_info.setdefault(source_id, {})
+            new_titles = [title for title in title_data if title not in source_info]
+            if new_titles:
+                latest_new[source_id] = new_titles
+
+            for title, data in title_data.items():
+                ranks = data.get("ranks", [])
+                url = data.get("url", "")
+                mobile_url = data.get("mobileUrl", "")
+
+                info = source_info.get(title)
+                if info is None:
+                    info = {
+                        "first_time": time_info,
+                        "last_time": time_info,
+                        "count": 1,
+                        "ranks": ranks,
+                        "url": url,
+                        "mobileUrl": mobile_url,
+                    }
+                    source_info[title] = info
+                    changed_infos.append(info)
+                    continue
+
+                merged_ranks = info["ranks"].copy()
+                for rank in ranks:
+                    if rank not in merged_ranks:
+                        merged_ranks.append(rank)
+
+                info["last_time"] = time_info
+                info["ranks"] = merged_ranks
+                info["count"] += 1
+                changed_infos.append(info)
+                if not info.get("url"):
+                    info["url"] = url
+                if not info.get("mobileUrl"):
+                    info["mobileUrl"] = mobile_url
+
+        self._update_weights(changed_infos)
+        self.times.append(time_info)
+        self.latest_titles = titles_by_id
+        self.latest_new = latest_new
+
+    def results(
+            self, current_platform_ids: Optional[List[str]] = None
+    ) -> Tuple[Dict, Dict, Dict]:
+        """返回 (all_results, id_to_name, title_info)，支持按当前监控平台过滤"""
+        source_ids = [
+            source_id
+            for source_id in self.title_info
+            if current_platform_ids is None or source_id in current_platform_ids
+        ]
+
+        all_results = {}
+        title_info = {}
+        for source_id in source_ids:
+            source_info = self.title_info[source_id]
+            title_info[source_id] = source_info
+            all_results[source_id] = {
+                title: {
+                    "ranks": info["ranks"],
+                    "url": info["url"],
+                    "mobileUrl": info["mobileUrl"],
+                }
+                for title, info in source_info.items()
+            }
+
+        id_to_name = {
+            source_id: self.id_to_name[source_id]
+            for source_id in source_ids
+            if source_id in self.id_to_name
+        }
+        return all_results, id_to_name, title_info
+
+    def new_titles(self, current_platform_ids: Optional[List[str]] = None) -> Dict:
+        """返回最新批次相对于当天更早批次的新增标题"""
+        if len(self.times) < 2:
+            return {}
+
+        new_titles = {}
+        for source_id, titles in self.latest_new.items():
+            if current_platform_ids is not None and source_id not in current_platform_ids:
+                continue
+            latest_source_titles = self.latest_titles[source_id]
+            new_titles[source_id] = {
+                title: latest_source_titles[title] for title in titles
+            }
+        return new_titles
+
+
 # === 数据处理 ===
-def save_titles_to_file(results: Dict, id_to_name: Dict, failed_ids: List) -> str:
-    """保存标题到文件"""
-    file_path = get_output_path("txt", f"{format_time_filename()}.txt")
+def save_snapshot(results: Dict, id_to_name: Dict, failed_ids: List) -> str:
+    """保存本次抓取快照，返回时间标识（HH时MM分）"""
+    time_info = format_time_filename()
+    # 复用进程内的存储实例，追加时无需重新读取字符串表
+    state = DayState.current()
+    with state.store.locked():
+        state.store.append(time_info, results, id_to_name, failed_ids)
+        state.sync()
+
+    if CONFIG["TXT_EXPORT"]:
+        save_titles_to_file(results, id_to_name, failed_ids, time_info)
+
+    return time_info
+
+
+def save_titles_to_file(
+        results: Dict,
+        id_to_name: Dict,
+        failed_ids: List,
+        time_info: Optional[str] = None,
+) -> str:
+    """导出标题到 txt 文件"""
+    file_path = get_output_path("txt", f"{time_info or format_time_filename()}.txt")
 
     with open(file_path, "w", encoding="utf-8") as f:
         for id_value, title_data in results.items():
@@ -535,10 +1562,19 @@ def save_titles_to_file(results: Dict, id_to_name: Dict, failed_ids: List) -> st
     return file_path
 
 
+# 频率词解析结果缓存：路径 -> ((mtime, size), 解析结果)
+_FREQUENCY_WORDS_CACHE = {}
+_FREQUENCY_WORDS_LOCK = threading.Lock()
+
+
 def load_frequency_words(
         frequency_file: Optional[str] = None,
-) -> Tuple[List[Dict], List[str]]:
-    """加载频率词配置"""
+) -> Tuple[List[Dict], List[str], "WordMatcher"]:
+    """加载频率词配置，返回 (词组, 过滤词, 编译好的匹配器)
+
+    解析结果按文件路径、修改时间和大小缓存，文件未变化时直接复用；
+    常驻模式和 API 服务中修改文件后下一次调用即自动重新加载。
+    """
     if frequency_file is None:
         frequency_file = os.environ.get(
             "FREQUENCY_WORDS_PATH", "config/frequency_words.txt"
@@ -548,6 +1584,25 @@ def load_frequency_words(
     if not frequency_path.exists():
         raise FileNotFoundError(f"频率词文件 {frequency_file} 不存在")
 
+    stat = frequency_path.stat()
+    cache_path = str(frequency_path.resolve())
+    file_key = (stat.st_mtime_ns, stat.st_size)
+    with _FREQUENCY_WORDS_LOCK:
+        cached = _FREQUENCY_WORDS_CACHE.get(cache_path)
+        if cached is not None and cached[0] == file_key:
+            return cached[1]
+
+        if cached is not None:
+            print(f"频率词文件已更新，重新加载: {frequency_file}")
+        result = parse_frequency_words(frequency_path)
+        _FREQUENCY_WORDS_CACHE[cache_path] = (file_key, result)
+        return result
+
+
+def parse_frequency_words(
+        frequency_path: Path,
+) -> Tuple[List[Dict], List[str], "WordMatcher"]:
+    """解析频率词文件并编译匹配器"""
     with open(frequency_path, "r", encoding="utf-8") as f:
         content = f.read()
 
@@ -586,7 +1641,146 @@ def load_frequency_words(
                 }
             )
 
-    return processed_groups, filter_words
+    return processed_groups, filter_words, WordMatcher(processed_groups, filter_words)
+
+
+@dataclass(frozen=True)
+class MatchResult:
+    """单个标题的匹配结论：命中的词组下标与是否被过滤词排除"""
+
+    group_index: Optional[int]
+    filtered: bool = False
+
+    @property
+    def matched(self) -> bool:
+        return self.group_index is not None
+
+
+class WordMatcher:
+    """频率词匹配器
+
+    过滤词与各词组的必须词、普通词统一转为小写后编译成一个 Aho–Corasick 自动机，
+    扫描一遍标题即可得到全部命中的关键词，再按词组顺序找出第一个满足的词组，
+    结果与逐词 `word.lower() in title.lower()` 判断一致。
+    匹配结论只取决于标题文本，按标题缓存，同一标题在计数、新增过滤和报告中只计算一次。
+    """
+
+    # 缓存上限，常驻进程中超过后整体清空
+    MAX_CACHED_RESULTS = 200000
+
+    def __init__(self, word_groups: List[Dict], filter_words: List[str]):
+        self.word_groups = word_groups
+        self._results = {}
+        self._keyword_ids = {}
+        self._always_found = set()  # 空关键词在任何标题中都成立
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [()]
+
+        self._filter_ids = frozenset(self._add_keyword(word) for word in filter_words)
+
+        self._groups = []
+        self._keyword_groups = {}
+        self._match_all_groups = []
+        for index, group in enumerate(word_groups):
+            required = frozenset(self._add_keyword(word) for word in group["required"])
+            normal = frozenset(self._add_keyword(word) for word in group["normal"])
+            self._groups.append((required, normal))
+            if not required and not normal:
+                self._match_all_groups.append(index)
+            for keyword_id in required | normal:
+                self._keyword_groups.setdefault(keyword_id, []).append(index)
+
+        self._build_fail_links()
+
+    def _add_keyword(self, word: str) -> int:
+        word = word.lower()
+        keyword_id = self._keyword_ids.get(word)
+        if keyword_id is not None:
+            return keyword_id
+
+        keyword_id = len(self._keyword_ids)
+        self._keyword_ids[word] = keyword_id
+        if not word:
+            self._always_found.add(keyword_id)
+            return keyword_id
+
+        node = 0
+        for char in word:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(())
+            node = next_node
+        self._output[node] += (keyword_id,)
+        return keyword_id
+
+    def _build_fail_links(self) -> None:
+        """按广度优先建立失败指针，并把失败链上的输出合并到每个节点"""
+        queue = list(self._goto[0].values())
+        for node in queue:
+            for char, child in self._goto[node].items():
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(char, 0) if node else 0
+                if self._fail[child] == child:
+                    self._fail[child] = 0
+                self._output[child] += self._output[self._fail[child]]
+                queue.append(child)
+
+    def find_keywords(self, title: str) -> set:
+        """返回标题中出现的全部关键词编号"""
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        found = set(self._always_found)
+
+        node = 0
+        for char in title.lower():
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if output[node]:
+                found.update(output[node])
+        return found
+
+    def evaluate(self, title: str) -> MatchResult:
+        """返回标题的匹配结论（按标题缓存）"""
+        result = self._results.get(title)
+        if result is not None:
+            return result
+
+        found = self.find_keywords(title)
+        if not self._filter_ids.isdisjoint(found):
+            result = MatchResult(None, filtered=True)
+        else:
+            candidates = set(self._match_all_groups)
+            for keyword_id in found:
+                candidates.update(self._keyword_groups.get(keyword_id, ()))
+
+            result = MatchResult(None)
+            for index in sorted(candidates):
+                required, normal = self._groups[index]
+                if required <= found and (not normal or not normal.isdisjoint(found)):
+                    result = MatchResult(index)
+                    break
+
+        if len(self._results) >= self.MAX_CACHED_RESULTS:
+            self._results.clear()
+        self._results[title] = result
+        return result
+
+    def match_group(self, title: str) -> Optional[int]:
+        """返回标题命中的第一个词组下标，被过滤或未命中时返回 None"""
+        return self.evaluate(title).group_index
+
+    def matches(self, title: str) -> bool:
+        """检查标题是否匹配词组规则（没有配置词组时匹配所有标题）"""
+        return not self.word_groups or self.match_group(title) is not None
 
 
 def parse_file_titles(file_path: Path) -> Tuple[Dict, Dict]:
@@ -659,40 +1853,57 @@ def parse_file_titles(file_path: Path) -> Tuple[Dict, Dict]:
     return titles_by_id, id_to_name
 
 
+def load_today_snapshots(
+        current_platform_ids: Optional[List[str]] = None,
+) -> List[Tuple[str, Dict, Dict]]:
+    """读取当天所有抓取快照，支持按当前监控平台过滤"""
+    store = SnapshotStore()
+    if store.exists():
+        snapshots = store.read()
+    else:
+        # 兼容只有 txt 文件的日期
+        txt_dir = store.path.parent / "txt"
+        if not txt_dir.exists():
+            return []
+        files = sorted([f for f in txt_dir.iterdir() if f.suffix == ".txt"])
+        snapshots = [
+            (file_path.stem, *parse_file_titles(file_path)) for file_path in files
+        ]
+
+    if current_platform_ids is None:
+        return snapshots
+
+    filtered_snapshots = []
+    for time_info, titles_by_id, file_id_to_name in snapshots:
+        filtered_titles_by_id = {}
+        filtered_id_to_name = {}
+
+        for source_id, title_data in titles_by_id.items():
+            if source_id in current_platform_ids:
+                filtered_titles_by_id[source_id] = title_data
+                if source_id in file_id_to_name:
+                    filtered_id_to_name[source_id] = file_id_to_name[source_id]
+
+        filtered_snapshots.append(
+            (time_info, filtered_titles_by_id, filtered_id_to_name)
+        )
+    return filtered_snapshots
+
+
 def read_all_today_titles(
         current_platform_ids: Optional[List[str]] = None,
 ) -> Tuple[Dict, Dict, Dict]:
-    """读取当天所有标题文件，支持按当前监控平台过滤"""
-    date_folder = format_date_folder()
-    txt_dir = Path("output") / date_folder / "txt"
-
-    if not txt_dir.exists():
-        return {}, {}, {}
+    """读取当天所有快照的标题，支持按当前监控平台过滤"""
+    if SnapshotStore().exists():
+        return DayState.today().results(current_platform_ids)
 
     all_results = {}
     final_id_to_name = {}
     title_info = {}
 
-    files = sorted([f for f in txt_dir.iterdir() if f.suffix == ".txt"])
-
-    for file_path in files:
-        time_info = file_path.stem
-
-        titles_by_id, file_id_to_name = parse_file_titles(file_path)
-
-        if current_platform_ids is not None:
-            filtered_titles_by_id = {}
-            filtered_id_to_name = {}
-
-            for source_id, title_data in titles_by_id.items():
-                if source_id in current_platform_ids:
-                    filtered_titles_by_id[source_id] = title_data
-                    if source_id in file_id_to_name:
-                        filtered_id_to_name[source_id] = file_id_to_name[source_id]
-
-            titles_by_id = filtered_titles_by_id
-            file_id_to_name = filtered_id_to_name
-
+    for time_info, titles_by_id, file_id_to_name in load_today_snapshots(
+            current_platform_ids
+    ):
         final_id_to_name.update(file_id_to_name)
 
         for source_id, title_data in titles_by_id.items():
@@ -776,44 +1987,40 @@ def process_source_data(
                     title_info[source_id][title]["mobileUrl"] = mobile_url
 
 
-def detect_latest_new_titles(current_platform_ids: Optional[List[str]] = None) -> Dict:
-    """检测当日最新批次的新增标题，支持按当前监控平台过滤"""
-    date_folder = format_date_folder()
-    txt_dir = Path("output") / date_folder / "txt"
+def detect_latest_new_titles(
+        current_platform_ids: Optional[List[str]] = None,
+        unchanged_ids: Optional[set] = None,
+) -> Dict:
+    """检测当日最新批次的新增标题，支持按当前监控平台过滤
 
-    if not txt_dir.exists():
-        return {}
+    unchanged_ids 中的平台内容与当日上次抓取一致，直接视为没有新增标题（仅用于 txt 旧路径，
+    快照库路径由 DayState 增量维护新增标题，同一分钟的快照会替换上一份，不能依赖该捷径）
+    """
+    if SnapshotStore().exists():
+        return DayState.today().new_titles(current_platform_ids)
 
-    files = sorted([f for f in txt_dir.iterdir() if f.suffix == ".txt"])
-    if len(files) < 2:
+    snapshots = load_today_snapshots(current_platform_ids)
+    if len(snapshots) < 2:
         return {}
 
-    # 解析最新文件
-    latest_file = files[-1]
-    latest_titles, _ = parse_file_titles(latest_file)
+    latest_titles = snapshots[-1][1]
 
-    # 如果指定了当前平台列表，过滤最新文件数据
-    if current_platform_ids is not None:
-        filtered_latest_titles = {}
-        for source_id, title_data in latest_titles.items():
-            if source_id in current_platform_ids:
-                filtered_latest_titles[source_id] = title_data
-        latest_titles = filtered_latest_titles
+    # 内容未变化的平台无需与历史比对
+    if unchanged_ids:
+        latest_titles = {
+            source_id: title_data
+            for source_id, title_data in latest_titles.items()
+            if source_id not in unchanged_ids
+        }
+    if not latest_titles:
+        return {}
 
     # 汇总历史标题（按平台过滤）
     historical_titles = {}
-    for file_path in files[:-1]:
-        historical_data, _ = parse_file_titles(file_path)
-
-        # 过滤历史数据
-        if current_platform_ids is not None:
-            filtered_historical_data = {}
-            for source_id, title_data in historical_data.items():
-                if source_id in current_platform_ids:
-                    filtered_historical_data[source_id] = title_data
-            historical_data = filtered_historical_data
-
+    for _, historical_data, _ in snapshots[:-1]:
         for source_id, titles_data in historical_data.items():
+            if source_id not in latest_titles:
+                continue
             if source_id not in historical_titles:
                 historical_titles[source_id] = set()
             for title in titles_data.keys():
@@ -872,44 +2079,89 @@ def calculate_news_weight(
     return total_weight
 
 
-def matches_word_groups(
-        title: str, word_groups: List[Dict], filter_words: List[str]
-) -> bool:
-    """检查标题是否匹配词组规则"""
-    # 如果没有配置词组，则匹配所有标题（支持显示全部新闻）
-    if not word_groups:
-        return True
+def score_news_weights(
+        flat_ranks: "np.ndarray",
+        lengths: "np.ndarray",
+        counts: "np.ndarray",
+        rank_threshold: Union[int, "np.ndarray"] = CONFIG["RANK_THRESHOLD"],
+) -> "np.ndarray":
+    """向量化计算一批新闻的权重，结果与逐条调用 calculate_news_weight 完全一致
 
-    title_lower = title.lower()
+    flat_ranks 为所有标题的排名依次拼接，lengths 为每个标题的排名个数，
+    counts 为出现次数；rank_threshold 可为标量或与 lengths 等长的数组。
+    """
+    weight_config = CONFIG["WEIGHT_CONFIG"]
+    flat_ranks = np.asarray(flat_ranks, dtype=np.int64)
+    lengths = np.asarray(lengths, dtype=np.int64)
+    counts = np.asarray(counts, dtype=np.int64)
 
-    # 过滤词检查
-    if any(filter_word.lower() in title_lower for filter_word in filter_words):
-        return False
+    ends = np.cumsum(lengths)
+    starts = ends - lengths
+    if np.ndim(rank_threshold):
+        rank_threshold = np.repeat(np.asarray(rank_threshold, dtype=np.int64), lengths)
 
-    # 词组匹配检查
-    for group in word_groups:
-        required_words = group["required"]
-        normal_words = group["normal"]
+    # 用前缀和求每个标题的区段和，空排名列表的区段和为 0
+    rank_score_sums = np.concatenate(([0], np.cumsum(11 - np.minimum(flat_ranks, 10))))
+    high_rank_sums = np.concatenate(([0], np.cumsum(flat_ranks <= rank_threshold)))
 
-        # 必须词检查
-        if required_words:
-            all_required_present = all(
-                req_word.lower() in title_lower for req_word in required_words
-            )
-            if not all_required_present:
-                continue
+    has_ranks = lengths > 0
+    divisors = np.where(has_ranks, lengths, 1)
 
-        # 普通词检查
-        if normal_words:
-            any_normal_present = any(
-                normal_word.lower() in title_lower for normal_word in normal_words
-            )
-            if not any_normal_present:
-                continue
+    # 运算顺序与 calculate_news_weight 保持一致，保证浮点结果逐位相同
+    rank_weight = (rank_score_sums[ends] - rank_score_sums[starts]) / divisors
+    frequency_weight = np.minimum(counts, 10) * 10
+    hotness_weight = (high_rank_sums[ends] - high_rank_sums[starts]) / divisors * 100
 
+    total_weight = (
+            rank_weight * weight_config["RANK_WEIGHT"]
+            + frequency_weight * weight_config["FREQUENCY_WEIGHT"]
+            + hotness_weight * weight_config["HOTNESS_WEIGHT"]
+    )
+    return np.where(has_ranks, total_weight, 0.0)
+
+
+def calculate_news_weights(
+        title_datas: List[Dict], rank_threshold: int = CONFIG["RANK_THRESHOLD"]
+) -> List[float]:
+    """批量计算新闻权重（title_data 与 calculate_news_weight 的参数相同）"""
+    if not NUMPY_AVAILABLE or not title_datas:
+        return [
+            calculate_news_weight(title_data, rank_threshold)
+            for title_data in title_datas
+        ]
+
+    rank_lists = [title_data.get("ranks", []) for title_data in title_datas]
+    lengths = np.fromiter(map(len, rank_lists), dtype=np.int64, count=len(rank_lists))
+    flat_ranks = np.fromiter(
+        (rank for ranks in rank_lists for rank in ranks),
+        dtype=np.int64,
+        count=int(lengths.sum()),
+    )
+    counts = np.fromiter(
+        (
+            title_data.get("count", len(ranks))
+            for title_data, ranks in zip(title_datas, rank_lists)
+        ),
+        dtype=np.int64,
+        count=len(rank_lists),
+    )
+    return score_news_weights(flat_ranks, lengths, counts, rank_threshold).tolist()
+
+
+def matches_word_groups(
+        title: str,
+        word_groups: List[Dict],
+        filter_words: List[str],
+        matcher: Optional[WordMatcher] = None,
+) -> bool:
+    """检查标题是否匹配词组规则，批量调用时应传入 load_frequency_words 返回的匹配器"""
+    # 如果没有配置词组，则匹配所有标题（支持显示全部新闻）
+    if not word_groups:
         return True
 
-    return False
+    if matcher is None:
+        matcher = WordMatcher(word_groups, filter_words)
+    return matcher.matches(title)
 
 
 def format_time_display(first_time: str, last_time: str) -> str:
@@ -922,44 +2174,41 @@ def format_time_display(first_time: str, last_time: str) -> str:
         return f"[{first_time} ~ {last_time}]"
 
 
-def format_rank_display(ranks: List[int], rank_threshold: int, format_type: str) -> str:
-    """统一的排名格式化方法"""
+# 各渠道的排名高亮标记
+RANK_HIGHLIGHTS = {
+    "html": ("<font color='red'><strong>", "</strong></font>"),
+    "feishu": ("<font color='red'>**", "**</font>"),
+    "dingtalk": ("**", "**"),
+    "wework": ("**", "**"),
+    "telegram": ("<b>", "</b>"),
+}
+
+
+def rank_span(ranks: List[int]) -> Optional[Tuple[int, int]]:
+    """排名区间 (最高, 最低)，无排名时为 None"""
     if not ranks:
-        return ""
+        return None
+    return min(ranks), max(ranks)
 
-    unique_ranks = sorted(set(ranks))
-    min_rank = unique_ranks[0]
-    max_rank = unique_ranks[-1]
-
-    if format_type == "html":
-        highlight_start = "<font color='red'><strong>"
-        highlight_end = "</strong></font>"
-    elif format_type == "feishu":
-        highlight_start = "<font color='red'>**"
-        highlight_end = "**</font>"
-    elif format_type == "dingtalk":
-        highlight_start = "**"
-        highlight_end = "**"
-    elif format_type == "wework":
-        highlight_start = "**"
-        highlight_end = "**"
-    elif format_type == "telegram":
-        highlight_start = "<b>"
-        highlight_end = "</b>"
-    else:
-        highlight_start = "**"
-        highlight_end = "**"
 
+def format_rank_span(
+        span: Optional[Tuple[int, int]], rank_threshold: int, format_type: str
+) -> str:
+    """按渠道格式化排名区间，最高排名进入阈值时高亮"""
+    if span is None:
+        return ""
+
+    min_rank, max_rank = span
+    text = f"[{min_rank}]" if min_rank == max_rank else f"[{min_rank} - {max_rank}]"
     if min_rank <= rank_threshold:
-        if min_rank == max_rank:
-            return f"{highlight_start}[{min_rank}]{highlight_end}"
-        else:
-            return f"{highlight_start}[{min_rank} - {max_rank}]{highlight_end}"
-    else:
-        if min_rank == max_rank:
-            return f"[{min_rank}]"
-        else:
-            return f"[{min_rank} - {max_rank}]"
+        highlight_start, highlight_end = RANK_HIGHLIGHTS.get(format_type, ("**", "**"))
+        return f"{highlight_start}{text}{highlight_end}"
+    return text
+
+
+def format_rank_display(ranks: List[int], rank_threshold: int, format_type: str) -> str:
+    """统一的排名格式化方法"""
+    return format_rank_span(rank_span(ranks), rank_threshold, format_type)
 
 
 def count_word_frequency(
@@ -971,6 +2220,7 @@ def count_word_frequency(
         rank_threshold: int = CONFIG["RANK_THRESHOLD"],
         new_titles: Optional[Dict] = None,
         mode: str = "daily",
+        matcher: Optional[WordMatcher] = None,
 ) -> Tuple[List[Dict], int]:
     """统计词频，支持必须词、频率词、过滤词，并标记新增标题"""
 
@@ -979,6 +2229,14 @@ def count_word_frequency(
         print("频率词配置为空，将显示所有新闻")
         word_groups = [{"required": [], "normal": [], "group_key": "全部新闻"}]
         filter_words = []  # 清空过滤词，显示所有新闻
+        matcher = None
+
+    if matcher is None:
+        matcher = WordMatcher(word_groups, filter_words)
+
+    # 当日聚合中已按当前配置保存了权重，排名阈值一致时直接复用，其余统一批量计算
+    reuse_weights = rank_threshold == CONFIG["RANK_THRESHOLD"]
+    pending_weights = []
 
     is_first_today = is_first_crawl_today()
 
@@ -1061,12 +2319,9 @@ def count_word_frequency(
             if title in processed_titles.get(source_id, {}):
                 continue
 
-            # 使用统一的匹配逻辑
-            matches_frequency_words = matches_word_groups(
-                title, word_groups, filter_words
-            )
-
-            if not matches_frequency_words:
+            # 使用统一的匹配逻辑，一次扫描得到命中的词组
+            group_index = matcher.match_group(title)
+            if group_index is None:
                 continue
 
             # 如果是增量模式或 current 模式第一次，统计匹配的新增新闻数量
@@ -1079,115 +2334,86 @@ def count_word_frequency(
             source_url = title_data.get("url", "")
             source_mobile_url = title_data.get("mobileUrl", "")
 
-            # 找到匹配的词组
-            title_lower = title.lower()
-            for group in word_groups:
-                required_words = group["required"]
-                normal_words = group["normal"]
-
-                # 如果是"全部新闻"模式，所有标题都匹配第一个（唯一的）词组
-                if len(word_groups) == 1 and word_groups[0]["group_key"] == "全部新闻":
-                    group_key = group["group_key"]
-                    word_stats[group_key]["count"] += 1
-                    if source_id not in word_stats[group_key]["titles"]:
-                        word_stats[group_key]["titles"][source_id] = []
-                else:
-                    # 原有的匹配逻辑
-                    if required_words:
-                        all_required_present = all(
-                            req_word.lower() in title_lower
-                            for req_word in required_words
-                        )
-                        if not all_required_present:
-                            continue
-
-                    if normal_words:
-                        any_normal_present = any(
-                            normal_word.lower() in title_lower
-                            for normal_word in normal_words
-                        )
-                        if not any_normal_present:
-                            continue
-
-                    group_key = group["group_key"]
-                    word_stats[group_key]["count"] += 1
-                    if source_id not in word_stats[group_key]["titles"]:
-                        word_stats[group_key]["titles"][source_id] = []
-
-                first_time = ""
-                last_time = ""
-                count_info = 1
-                ranks = source_ranks if source_ranks else []
-                url = source_url
-                mobile_url = source_mobile_url
-
-                # 对于 current 模式，从历史统计信息中获取完整数据
-                if (
-                        mode == "current"
-                        and title_info
-                        and source_id in title_info
-                        and title in title_info[source_id]
-                ):
-                    info = title_info[source_id][title]
-                    first_time = info.get("first_time", "")
-                    last_time = info.get("last_time", "")
-                    count_info = info.get("count", 1)
-                    if "ranks" in info and info["ranks"]:
-                        ranks = info["ranks"]
-                    url = info.get("url", source_url)
-                    mobile_url = info.get("mobileUrl", source_mobile_url)
-                elif (
-                        title_info
-                        and source_id in title_info
-                        and title in title_info[source_id]
-                ):
-                    info = title_info[source_id][title]
-                    first_time = info.get("first_time", "")
-                    last_time = info.get("last_time", "")
-                    count_info = info.get("count", 1)
-                    if "ranks" in info and info["ranks"]:
-                        ranks = info["ranks"]
-                    url = info.get("url", source_url)
-                    mobile_url = info.get("mobileUrl", source_mobile_url)
-
-                if not ranks:
-                    ranks = [99]
-
-                time_display = format_time_display(first_time, last_time)
-
-                source_name = id_to_name.get(source_id, source_id)
+            group_key = word_groups[group_index]["group_key"]
+            word_stats[group_key]["count"] += 1
+            if source_id not in word_stats[group_key]["titles"]:
+                word_stats[group_key]["titles"][source_id] = []
 
-                # 判断是否为新增
-                is_new = False
-                if all_news_are_new:
-                    # 增量模式下所有处理的新闻都是新增，或者当天第一次的所有新闻都是新增
-                    is_new = True
-                elif new_titles and source_id in new_titles:
-                    # 检查是否在新增列表中
-                    new_titles_for_source = new_titles[source_id]
-                    is_new = title in new_titles_for_source
-
-                word_stats[group_key]["titles"][source_id].append(
-                    {
-                        "title": title,
-                        "source_name": source_name,
-                        "first_time": first_time,
-                        "last_time": last_time,
-                        "time_display": time_display,
-                        "count": count_info,
-                        "ranks": ranks,
-                        "rank_threshold": rank_threshold,
-                        "url": url,
-                        "mobileUrl": mobile_url,
-                        "is_new": is_new,
-                    }
-                )
+            first_time = ""
+            last_time = ""
+            count_info = 1
+            weight = None
+            ranks = source_ranks if source_ranks else []
+            url = source_url
+            mobile_url = source_mobile_url
 
-                if source_id not in processed_titles:
-                    processed_titles[source_id] = {}
-                processed_titles[source_id][title] = True
+            # 对于 current 模式，从历史统计信息中获取完整数据
+            if (
+                    mode == "current"
+                    and title_info
+                    and source_id in title_info
+                    and title in title_info[source_id]
+            ):
+                info = title_info[source_id][title]
+                first_time = info.get("first_time", "")
+                last_time = info.get("last_time", "")
+                count_info = info.get("count", 1)
+                if "ranks" in info and info["ranks"]:
+                    ranks = info["ranks"]
+                    weight = info.get("weight") if reuse_weights else None
+                url = info.get("url", source_url)
+                mobile_url = info.get("mobileUrl", source_mobile_url)
+            elif (
+                    title_info
+                    and source_id in title_info
+                    and title in title_info[source_id]
+            ):
+                info = title_info[source_id][title]
+                first_time = info.get("first_time", "")
+                last_time = info.get("last_time", "")
+                count_info = info.get("count", 1)
+                if "ranks" in info and info["ranks"]:
+                    ranks = info["ranks"]
+                    weight = info.get("weight") if reuse_weights else None
+                url = info.get("url", source_url)
+                mobile_url = info.get("mobileUrl", source_mobile_url)
+
+            if not ranks:
+                ranks = [99]
+
+            time_display = format_time_display(first_time, last_time)
+
+            source_name = id_to_name.get(source_id, source_id)
+
+            # 判断是否为新增
+            is_new = False
+            if all_news_are_new:
+                # 增量模式下所有处理的新闻都是新增，或者当天第一次的所有新闻都是新增
+                is_new = True
+            elif new_titles and source_id in new_titles:
+                # 检查是否在新增列表中
+                new_titles_for_source = new_titles[source_id]
+                is_new = title in new_titles_for_source
+
+            title_entry = {
+                "title": title,
+                "source_name": source_name,
+                "first_time": first_time,
+                "last_time": last_time,
+                "time_display": time_display,
+                "count": count_info,
+                "ranks": ranks,
+                "rank_threshold": rank_threshold,
+                "url": url,
+                "mobileUrl": mobile_url,
+                "is_new": is_new,
+                "weight": weight,
+            }
+            word_stats[group_key]["titles"][source_id].append(title_entry)
+            if weight is None:
+                pending_weights.append(title_entry)
 
-                break
+            processed_titles[source_id][title] = True
 
     # 最后统一打印汇总信息
     if mode == "incremental":
@@ -1239,17 +2465,22 @@ def count_word_frequency(
                 f"当前榜单模式：{total_input_news} 条当前榜单新闻中有 {matched_count} 条{filter_status}"
             )
 
+    for title_entry, weight in zip(
+            pending_weights, calculate_news_weights(pending_weights, rank_threshold)
+    ):
+        title_entry["weight"] = weight
+
     stats = []
     for group_key, data in word_stats.items():
         all_titles = []
         for source_id, title_list in data["titles"].items():
             all_titles.extend(title_list)
 
-        # 按权重排序
+        # 按权重排序（权重已在构建标题数据时算好）
         sorted_titles = sorted(
             all_titles,
             key=lambda x: (
-                -calculate_news_weight(x, rank_threshold),
+                -x["weight"],
                 min(x["ranks"]) if x["ranks"] else 999,
                 -x["count"],
             ),
@@ -1273,14 +2504,30 @@ def count_word_frequency(
 
 
 # === 报告生成 ===
+def prepare_report_title(title_data: Dict) -> Dict:
+    """
+    补全各渠道共用的标题字段：清洗后的标题、链接、排名区间，
+    以及按 (渠道, 是否显示来源, 是否标记新增) 缓存的格式化片段
+    """
+    title_data["display_title"] = clean_title(title_data["title"])
+    title_data["link_url"] = title_data["mobile_url"] or title_data["url"]
+    title_data["rank_span"] = rank_span(title_data["ranks"])
+    title_data["fragments"] = {}
+    return title_data
+
+
 def prepare_report_data(
         stats: List[Dict],
         failed_ids: Optional[List] = None,
         new_titles: Optional[Dict] = None,
         id_to_name: Optional[Dict] = None,
         mode: str = "daily",
+        matcher: Optional[WordMatcher] = None,
 ) -> Dict:
-    """准备报告数据"""
+    """
+    准备报告数据，matcher 为空时从频率词文件加载
+    结果是一次报告的中间文档，飞书、钉钉、企业微信、Telegram 与 HTML 都从它渲染
+    """
     processed_new_titles = []
 
     # 在增量模式下隐藏新增新闻区域
@@ -1290,11 +2537,12 @@ def prepare_report_data(
     if not hide_new_section:
         filtered_new_titles = {}
         if new_titles and id_to_name:
-            word_groups, filter_words = load_frequency_words()
+            if matcher is None:
+                _, _, matcher = load_frequency_words()
             for source_id, titles_data in new_titles.items():
                 filtered_titles = {}
                 for title, title_data in titles_data.items():
-                    if matches_word_groups(title, word_groups, filter_words):
+                    if matcher.matches(title):
                         filtered_titles[title] = title_data
                 if filtered_titles:
                     filtered_new_titles[source_id] = filtered_titles
@@ -1320,7 +2568,7 @@ def prepare_report_data(
                         "mobile_url": mobile_url,
                         "is_new": True,
                     }
-                    source_titles.append(processed_title)
+                    source_titles.append(prepare_report_title(processed_title))
 
                 if source_titles:
                     processed_new_titles.append(
@@ -1349,7 +2597,7 @@ def prepare_report_data(
                 "mobile_url": title_data.get("mobileUrl", ""),
                 "is_new": title_data.get("is_new", False),
             }
-            processed_titles.append(processed_title)
+            processed_titles.append(prepare_report_title(processed_title))
 
         processed_stats.append(
             {
@@ -1370,139 +2618,128 @@ def prepare_report_data(
     }
 
 
-def format_title_for_platform(
-        platform: str, title_data: Dict, show_source: bool = True
+# 文本渠道的标题样式：来源、链接、时间、次数的模板
+TITLE_STYLES = {
+    "feishu": {
+        "source": "<font color='grey'>[{}]</font> ",
+        "link": "[{title}]({url})",
+        "time": " <font color='grey'>- {}</font>",
+        "count": " <font color='green'>({}次)</font>",
+    },
+    "dingtalk": {
+        "source": "[{}] ",
+        "link": "[{title}]({url})",
+        "time": " - {}",
+        "count": " ({}次)",
+    },
+    "wework": {
+        "source": "[{}] ",
+        "link": "[{title}]({url})",
+        "time": " - {}",
+        "count": " ({}次)",
+    },
+    "telegram": {
+        "source": "[{}] ",
+        "link": '<a href="{url}">{escaped_title}</a>',
+        "time": " <code>- {}</code>",
+        "count": " <code>({}次)</code>",
+    },
+}
+
+
+def _format_text_title(
+        style: Dict, title_data: Dict, rank_display: str, show_source: bool, is_new: bool
 ) -> str:
-    """统一的标题格式化方法"""
-    rank_display = format_rank_display(
-        title_data["ranks"], title_data["rank_threshold"], platform
-    )
-
-    link_url = title_data["mobile_url"] or title_data["url"]
-
-    cleaned_title = clean_title(title_data["title"])
-
-    if platform == "feishu":
-        if link_url:
-            formatted_title = f"[{cleaned_title}]({link_url})"
-        else:
-            formatted_title = cleaned_title
-
-        title_prefix = "🆕 " if title_data.get("is_new") else ""
-
-        if show_source:
-            result = f"<font color='grey'>[{title_data['source_name']}]</font> {title_prefix}{formatted_title}"
-        else:
-            result = f"{title_prefix}{formatted_title}"
-
-        if rank_display:
-            result += f" {rank_display}"
-        if title_data["time_display"]:
-            result += f" <font color='grey'>- {title_data['time_display']}</font>"
-        if title_data["count"] > 1:
-            result += f" <font color='green'>({title_data['count']}次)</font>"
-
-        return result
-
-    elif platform == "dingtalk":
-        if link_url:
-            formatted_title = f"[{cleaned_title}]({link_url})"
-        else:
-            formatted_title = cleaned_title
-
-        title_prefix = "🆕 " if title_data.get("is_new") else ""
-
-        if show_source:
-            result = f"[{title_data['source_name']}] {title_prefix}{formatted_title}"
-        else:
-            result = f"{title_prefix}{formatted_title}"
-
-        if rank_display:
-            result += f" {rank_display}"
-        if title_data["time_display"]:
-            result += f" - {title_data['time_display']}"
-        if title_data["count"] > 1:
-            result += f" ({title_data['count']}次)"
-
-        return result
-
-    elif platform == "wework":
-        if link_url:
-            formatted_title = f"[{cleaned_title}]({link_url})"
-        else:
-            formatted_title = cleaned_title
-
-        title_prefix = "🆕 " if title_data.get("is_new") else ""
-
-        if show_source:
-            result = f"[{title_data['source_name']}] {title_prefix}{formatted_title}"
-        else:
-            result = f"{title_prefix}{formatted_title}"
+    cleaned_title = title_data["display_title"]
+    link_url = title_data["link_url"]
+    if link_url:
+        formatted_title = style["link"].format(
+            title=cleaned_title,
+            escaped_title=html_escape(cleaned_title),
+            url=link_url,
+        )
+    else:
+        formatted_title = cleaned_title
 
-        if rank_display:
-            result += f" {rank_display}"
-        if title_data["time_display"]:
-            result += f" - {title_data['time_display']}"
-        if title_data["count"] > 1:
-            result += f" ({title_data['count']}次)"
+    title_prefix = "🆕 " if is_new else ""
 
-        return result
+    if show_source:
+        result = style["source"].format(title_data["source_name"]) + title_prefix + formatted_title
+    else:
+        result = f"{title_prefix}{formatted_title}"
 
-    elif platform == "telegram":
-        if link_url:
-            formatted_title = f'<a href="{link_url}">{html_escape(cleaned_title)}</a>'
-        else:
-            formatted_title = cleaned_title
+    if rank_display:
+        result += f" {rank_display}"
+    if title_data["time_display"]:
+        result += style["time"].format(title_data["time_display"])
+    if title_data["count"] > 1:
+        result += style["count"].format(title_data["count"])
 
-        title_prefix = "🆕 " if title_data.get("is_new") else ""
+    return result
 
-        if show_source:
-            result = f"[{title_data['source_name']}] {title_prefix}{formatted_title}"
-        else:
-            result = f"{title_prefix}{formatted_title}"
 
-        if rank_display:
-            result += f" {rank_display}"
-        if title_data["time_display"]:
-            result += f" <code>- {title_data['time_display']}</code>"
-        if title_data["count"] > 1:
-            result += f" <code>({title_data['count']}次)</code>"
+def _format_html_title(title_data: Dict, rank_display: str, is_new: bool) -> str:
+    link_url = title_data["link_url"]
 
-        return result
+    escaped_title = html_escape(title_data["display_title"])
+    escaped_source_name = html_escape(title_data["source_name"])
 
-    elif platform == "html":
-        rank_display = format_rank_display(
-            title_data["ranks"], title_data["rank_threshold"], "html"
+    if link_url:
+        escaped_url = html_escape(link_url)
+        formatted_title = f'[{escaped_source_name}] <a href="{escaped_url}" target="_blank" class="news-link">{escaped_title}</a>'
+    else:
+        formatted_title = (
+            f'[{escaped_source_name}] <span class="no-link">{escaped_title}</span>'
         )
 
-        link_url = title_data["mobile_url"] or title_data["url"]
+    if rank_display:
+        formatted_title += f" {rank_display}"
+    if title_data["time_display"]:
+        escaped_time = html_escape(title_data["time_display"])
+        formatted_title += f" <font color='grey'>- {escaped_time}</font>"
+    if title_data["count"] > 1:
+        formatted_title += f" <font color='green'>({title_data['count']}次)</font>"
 
-        escaped_title = html_escape(cleaned_title)
-        escaped_source_name = html_escape(title_data["source_name"])
+    if is_new:
+        formatted_title = f"<div class='new-title'>🆕 {formatted_title}</div>"
 
-        if link_url:
-            escaped_url = html_escape(link_url)
-            formatted_title = f'[{escaped_source_name}] <a href="{escaped_url}" target="_blank" class="news-link">{escaped_title}</a>'
-        else:
-            formatted_title = (
-                f'[{escaped_source_name}] <span class="no-link">{escaped_title}</span>'
-            )
-
-        if rank_display:
-            formatted_title += f" {rank_display}"
-        if title_data["time_display"]:
-            escaped_time = html_escape(title_data["time_display"])
-            formatted_title += f" <font color='grey'>- {escaped_time}</font>"
-        if title_data["count"] > 1:
-            formatted_title += f" <font color='green'>({title_data['count']}次)</font>"
-
-        if title_data.get("is_new"):
-            formatted_title = f"<div class='new-title'>🆕 {formatted_title}</div>"
+    return formatted_title
 
-        return formatted_title
 
+def format_title_for_platform(
+        platform: str,
+        title_data: Dict,
+        show_source: bool = True,
+        is_new: Optional[bool] = None,
+) -> str:
+    """
+    统一的标题格式化方法
+    is_new 为空时取 title_data["is_new"]；经 prepare_report_title 处理过的标题按渠道缓存结果
+    """
+    if "fragments" not in title_data:
+        title_data = prepare_report_title(dict(title_data))
+    if is_new is None:
+        is_new = bool(title_data.get("is_new"))
+
+    key = (platform, show_source, is_new)
+    fragment = title_data["fragments"].get(key)
+    if fragment is not None:
+        return fragment
+
+    rank_display = format_rank_span(
+        title_data["rank_span"], title_data["rank_threshold"], platform
+    )
+    if platform in TITLE_STYLES:
+        fragment = _format_text_title(
+            TITLE_STYLES[platform], title_data, rank_display, show_source, is_new
+        )
+    elif platform == "html":
+        fragment = _format_html_title(title_data, rank_display, is_new)
     else:
-        return cleaned_title
+        fragment = title_data["display_title"]
+
+    title_data["fragments"][key] = fragment
+    return fragment
 
 
 def generate_html_report(
@@ -1513,8 +2750,10 @@ def generate_html_report(
         id_to_name: Optional[Dict] = None,
         mode: str = "daily",
         is_daily_summary: bool = False,
+        matcher: Optional[WordMatcher] = None,
+        html_parts: Optional[List[str]] = None,
 ) -> str:
-    """生成HTML报告"""
+    """生成HTML报告，传入 html_parts 时同时收集写入的内容（供截图复用）"""
     if is_daily_summary:
         if mode == "current":
             filename = "当前榜单汇总.html"
@@ -1527,31 +2766,69 @@ def generate_html_report(
 
     file_path = get_output_path("html", filename)
 
-    report_data = prepare_report_data(stats, failed_ids, new_titles, id_to_name, mode)
-
-    html_content = render_html_content(
-        report_data, total_titles, is_daily_summary, mode
+    report_data = prepare_report_data(
+        stats, failed_ids, new_titles, id_to_name, mode, matcher
     )
 
-    with open(file_path, "w", encoding="utf-8") as f:
-        f.write(html_content)
+    # 边渲染边写入临时文件，完成后原子替换，内存中不保留整页
+    tmp_path = f"{file_path}.tmp"
+    chunks = iter_html_content(report_data, total_titles, is_daily_summary, mode)
+    if html_parts is not None:
+        chunks = _collect(chunks, html_parts)
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.writelines(chunks)
+    os.replace(tmp_path, file_path)
 
     if is_daily_summary:
-        root_file_path = Path("index.html")
-        with open(root_file_path, "w", encoding="utf-8") as f:
-            f.write(html_content)
+        publish_file(file_path, "index.html")
 
     return file_path
 
 
-def render_html_content(
+def _collect(chunks: Iterator[str], parts: List[str]) -> Iterator[str]:
+    for chunk in chunks:
+        parts.append(chunk)
+        yield chunk
+
+
+def publish_file(src: str, dest: str) -> None:
+    """
+    把已写好的文件原子地发布到 dest：优先硬链接（不复制内容），
+    跨设备或文件系统不支持时退回复制；src 之后只会被整体替换，不会原地改写
+    """
+    tmp_path = f"{dest}.tmp"
+    if os.path.lexists(tmp_path):
+        os.remove(tmp_path)
+    try:
+        os.link(src, tmp_path)
+    except OSError:
+        shutil.copyfile(src, tmp_path)
+    os.replace(tmp_path, dest)
+
+
+def _html_title_link(title_data: Dict) -> str:
+    """HTML 页面中的标题链接片段（与词组、新增区域共用缓存）"""
+    key = ("html_link",)
+    fragment = title_data["fragments"].get(key)
+    if fragment is None:
+        escaped_title = html_escape(title_data["title"])
+        if title_data["link_url"]:
+            escaped_url = html_escape(title_data["link_url"])
+            fragment = f'<a href="{escaped_url}" target="_blank" class="news-link">{escaped_title}</a>'
+        else:
+            fragment = escaped_title
+        title_data["fragments"][key] = fragment
+    return fragment
+
+
+def iter_html_content(
         report_data: Dict,
         total_titles: int,
         is_daily_summary: bool = False,
         mode: str = "daily",
-) -> str:
-    """渲染HTML内容"""
-    html = """
+) -> Iterator[str]:
+    """逐段生成HTML内容，调用方边生成边写入，不在内存中拼出整页"""
+    yield """
     <!DOCTYPE html>
     <html>
     <head>
@@ -1911,43 +3188,43 @@ def render_html_content(
     # 处理报告类型显示
     if is_daily_summary:
         if mode == "current":
-            html += "当前榜单"
+            yield "当前榜单"
         elif mode == "incremental":
-            html += "增量模式"
+            yield "增量模式"
         else:
-            html += "当日汇总"
+            yield "当日汇总"
     else:
-        html += "实时分析"
+        yield "实时分析"
 
-    html += """</span>
+    yield """</span>
                     </div>
                     <div class="info-item">
                         <span class="info-label">新闻总数</span>
                         <span class="info-value">"""
 
-    html += f"{total_titles} 条"
+    yield f"{total_titles} 条"
 
     # 计算筛选后的热点新闻数量
     hot_news_count = sum(len(stat["titles"]) for stat in report_data["stats"])
 
-    html += """</span>
+    yield """</span>
                     </div>
                     <div class="info-item">
                         <span class="info-label">热点新闻</span>
                         <span class="info-value">"""
 
-    html += f"{hot_news_count} 条"
+    yield f"{hot_news_count} 条"
 
-    html += """</span>
+    yield """</span>
                     </div>
                     <div class="info-item">
                         <span class="info-label">生成时间</span>
                         <span class="info-value">"""
 
     now = get_beijing_time()
-    html += now.strftime("%m-%d %H:%M")
+    yield now.strftime("%m-%d %H:%M")
 
-    html += """</span>
+    yield """</span>
                     </div>
                 </div>
             </div>
@@ -1956,13 +3233,13 @@ def render_html_content(
 
     # 处理失败ID错误信息
     if report_data["failed_ids"]:
-        html += """
+        yield """
                 <div class="error-section">
                     <div class="error-title">⚠️ 请求失败的平台</div>
                     <ul class="error-list">"""
         for id_value in report_data["failed_ids"]:
-            html += f'<li class="error-item">{html_escape(id_value)}</li>'
-        html += """
+            yield f'<li class="error-item">{html_escape(id_value)}</li>'
+        yield """
                     </ul>
                 </div>"""
 
@@ -1983,7 +3260,7 @@ def render_html_content(
 
             escaped_word = html_escape(stat["word"])
 
-            html += f"""
+            yield f"""
                 <div class="word-group">
                     <div class="word-header">
                         <div class="word-info">
@@ -1998,7 +3275,7 @@ def render_html_content(
                 is_new = title_data.get("is_new", False)
                 new_class = "new" if is_new else ""
 
-                html += f"""
+                yield f"""
                     <div class="news-item {new_class}">
                         <div class="news-number">{j}</div>
                         <div class="news-content">
@@ -2006,10 +3283,9 @@ def render_html_content(
                                 <span class="source-name">{html_escape(title_data["source_name"])}</span>"""
 
                 # 处理排名显示
-                ranks = title_data.get("ranks", [])
-                if ranks:
-                    min_rank = min(ranks)
-                    max_rank = max(ranks)
+                span = title_data["rank_span"]
+                if span:
+                    min_rank, max_rank = span
                     rank_threshold = title_data.get("rank_threshold", 10)
 
                     # 确定排名等级
@@ -2025,7 +3301,7 @@ def render_html_content(
                     else:
                         rank_text = f"{min_rank}-{max_rank}"
 
-                    html += f'<span class="rank-num {rank_class}">{rank_text}</span>'
+                    yield f'<span class="rank-num {rank_class}">{rank_text}</span>'
 
                 # 处理时间显示
                 time_display = title_data.get("time_display", "")
@@ -2036,40 +3312,33 @@ def render_html_content(
                         .replace("[", "")
                         .replace("]", "")
                     )
-                    html += (
+                    yield (
                         f'<span class="time-info">{html_escape(simplified_time)}</span>'
                     )
 
                 # 处理出现次数
                 count_info = title_data.get("count", 1)
                 if count_info > 1:
-                    html += f'<span class="count-info">{count_info}次</span>'
+                    yield f'<span class="count-info">{count_info}次</span>'
 
-                html += """
+                yield """
                             </div>
                             <div class="news-title">"""
 
                 # 处理标题和链接
-                escaped_title = html_escape(title_data["title"])
-                link_url = title_data.get("mobile_url") or title_data.get("url", "")
-
-                if link_url:
-                    escaped_url = html_escape(link_url)
-                    html += f'<a href="{escaped_url}" target="_blank" class="news-link">{escaped_title}</a>'
-                else:
-                    html += escaped_title
+                yield _html_title_link(title_data)
 
-                html += """
+                yield """
                             </div>
                         </div>
                     </div>"""
 
-            html += """
+            yield """
                 </div>"""
 
     # 处理新增新闻区域
     if report_data["new_titles"]:
-        html += f"""
+        yield f"""
                 <div class="new-section">
                     <div class="new-section-title">本次新增热点 (共 {report_data['total_new_count']} 条)</div>"""
 
@@ -2077,7 +3346,7 @@ def render_html_content(
             escaped_source = html_escape(source_data["source_name"])
             titles_count = len(source_data["titles"])
 
-            html += f"""
+            yield f"""
                     <div class="new-source-group">
                         <div class="new-source-title">{escaped_source} · {titles_count}条</div>"""
 
@@ -2101,7 +3370,7 @@ def render_html_content(
                 else:
                     rank_text = "?"
 
-                html += f"""
+                yield f"""
                         <div class="new-item">
                             <div class="new-item-number">{idx}</div>
                             <div class="new-item-rank {rank_class}">{rank_text}</div>
@@ -2109,34 +3378,35 @@ def render_html_content(
                                 <div class="new-item-title">"""
 
                 # 处理新增新闻的链接
-                escaped_title = html_escape(title_data["title"])
-                link_url = title_data.get("mobile_url") or title_data.get("url", "")
+                yield _html_title_link(title_data)
 
-                if link_url:
-                    escaped_url = html_escape(link_url)
-                    html += f'<a href="{escaped_url}" target="_blank" class="news-link">{escaped_title}</a>'
-                else:
-                    html += escaped_title
-
-                html += """
+                yield """
                                 </div>
                             </div>
                         </div>"""
 
-            html += """
+            yield """
                     </div>"""
 
-        html += """
+        yield """
                 </div>"""
 
-    html += """
+    yield """
             </div>
         </div>
     </body>
     </html>
     """
 
-    return html
+
+def render_html_content(
+        report_data: Dict,
+        total_titles: int,
+        is_daily_summary: bool = False,
+        mode: str = "daily",
+) -> str:
+    """渲染HTML内容"""
+    return "".join(iter_html_content(report_data, total_titles, is_daily_summary, mode))
 
 
 def render_feishu_content(
@@ -2198,10 +3468,8 @@ def render_feishu_content(
             )
 
             for j, title_data in enumerate(source_data["titles"], 1):
-                title_data_copy = title_data.copy()
-                title_data_copy["is_new"] = False
                 formatted_title = format_title_for_platform(
-                    "feishu", title_data_copy, show_source=False
+                    "feishu", title_data, show_source=False, is_new=False
                 )
                 text_content += f"  {j}. {formatted_title}\n"
 
@@ -2294,10 +3562,8 @@ def render_dingtalk_content(
             text_content += f"**{source_data['source_name']}** ({len(source_data['titles'])} 条):\n\n"
 
             for j, title_data in enumerate(source_data["titles"], 1):
-                title_data_copy = title_data.copy()
-                title_data_copy["is_new"] = False
                 formatted_title = format_title_for_platform(
-                    "dingtalk", title_data_copy, show_source=False
+                    "dingtalk", title_data, show_source=False, is_new=False
                 )
                 text_content += f"  {j}. {formatted_title}\n"
 
@@ -2319,6 +3585,77 @@ def render_dingtalk_content(
     return text_content
 
 
+def format_batch_title(
+        format_type: str,
+        title_data: Dict,
+        show_source: bool = True,
+        is_new: Optional[bool] = None,
+) -> str:
+    """分批消息中的标题：企业微信/Telegram 用渠道格式，其他类型只输出原标题"""
+    if format_type in ("wework", "telegram"):
+        return format_title_for_platform(format_type, title_data, show_source, is_new)
+    return title_data["title"]
+
+
+class MessageBatcher:
+    """
+    按字节上限拼装分批消息：记录每个片段的 UTF-8 字节数与当前批次的累计字节数，
+    片段只编码一次，批次在封口时一次性拼接
+    """
+
+    def __init__(self, header: str, footer: str, max_bytes: int):
+        self.header = header
+        self.footer = footer
+        self.header_bytes = utf8_len(header)
+        # 批次加上页脚必须严格小于上限
+        self.limit = max_bytes - utf8_len(footer)
+        self.batches: List[str] = []
+        self.parts = [header]
+        self.size = self.header_bytes
+        self.has_content = False
+
+    def fits(self, size: int) -> bool:
+        return self.size + size < self.limit
+
+    def append(self, text: str, size: Optional[int] = None) -> None:
+        """无条件追加"""
+        self.parts.append(text)
+        self.size += utf8_len(text) if size is None else size
+
+    def try_append(self, text: str) -> None:
+        """放得下才追加，放不下时丢弃（用于分隔符）"""
+        size = utf8_len(text)
+        if self.fits(size):
+            self.append(text, size)
+
+    def put(self, text: str, prefix: Tuple[str, ...] = ()) -> None:
+        """
+        追加内容；当前批次放不下时封口，新批次以 页眉 + prefix + text 开头，
+        prefix 为需要在新批次中重复的上下文标题
+        """
+        size = utf8_len(text)
+        if not self.fits(size):
+            if self.has_content:
+                self.close()
+            self.parts = [self.header, *prefix]
+            self.size = self.header_bytes + sum(utf8_len(p) for p in prefix)
+        self.append(text, size)
+        self.has_content = True
+
+    def close(self) -> None:
+        self.parts.append(self.footer)
+        self.batches.append("".join(self.parts))
+
+    def finish(self) -> List[str]:
+        if self.has_content:
+            self.close()
+        return self.batches
+
+
+def utf8_len(text: str) -> int:
+    return len(text.encode("utf-8"))
+
+
 def split_content_into_batches(
         report_data: Dict,
         format_type: str,
@@ -2327,8 +3664,6 @@ def split_content_into_batches(
         mode: str = "daily",
 ) -> List[str]:
     """分批处理消息内容，确保词组标题+至少第一条新闻的完整性"""
-    batches = []
-
     total_titles = sum(
         len(stat["titles"]) for stat in report_data["stats"] if stat["count"] > 0
     )
@@ -2357,9 +3692,6 @@ def split_content_into_batches(
         elif format_type == "telegram":
             stats_header = f"📊 热点词汇统计\n\n"
 
-    current_batch = base_header
-    current_batch_has_content = False
-
     if (
             not report_data["stats"]
             and not report_data["new_titles"]
@@ -2372,27 +3704,16 @@ def split_content_into_batches(
         else:
             mode_text = "暂无匹配的热点词汇"
         simple_content = f"📭 {mode_text}\n\n"
-        final_content = base_header + simple_content + base_footer
-        batches.append(final_content)
-        return batches
+        return [base_header + simple_content + base_footer]
+
+    batcher = MessageBatcher(base_header, base_footer, max_bytes)
 
     # 处理热点词汇统计
     if report_data["stats"]:
         total_count = len(report_data["stats"])
 
         # 添加统计标题
-        test_content = current_batch + stats_header
-        if (
-                len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                < max_bytes
-        ):
-            current_batch = test_content
-            current_batch_has_content = True
-        else:
-            if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            current_batch = base_header + stats_header
-            current_batch_has_content = True
+        batcher.put(stats_header)
 
         # 逐个处理词组（确保词组标题+第一条新闻的原子性）
         for i, stat in enumerate(report_data["stats"]):
@@ -2424,86 +3745,28 @@ def split_content_into_batches(
             # 构建第一条新闻
             first_news_line = ""
             if stat["titles"]:
-                first_title_data = stat["titles"][0]
-                if format_type == "wework":
-                    formatted_title = format_title_for_platform(
-                        "wework", first_title_data, show_source=True
-                    )
-                elif format_type == "telegram":
-                    formatted_title = format_title_for_platform(
-                        "telegram", first_title_data, show_source=True
-                    )
-                else:
-                    formatted_title = f"{first_title_data['title']}"
-
+                formatted_title = format_batch_title(format_type, stat["titles"][0])
                 first_news_line = f"  1. {formatted_title}\n"
                 if len(stat["titles"]) > 1:
                     first_news_line += "\n"
 
             # 原子性检查：词组标题+第一条新闻必须一起处理
-            word_with_first_news = word_header + first_news_line
-            test_content = current_batch + word_with_first_news
-
-            if (
-                    len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                    >= max_bytes
-            ):
-                # 当前批次容纳不下，开启新批次
-                if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + stats_header + word_with_first_news
-                current_batch_has_content = True
-                start_index = 1
-            else:
-                current_batch = test_content
-                current_batch_has_content = True
-                start_index = 1
-
-            # 处理剩余新闻条目
-            for j in range(start_index, len(stat["titles"])):
-                title_data = stat["titles"][j]
-                if format_type == "wework":
-                    formatted_title = format_title_for_platform(
-                        "wework", title_data, show_source=True
-                    )
-                elif format_type == "telegram":
-                    formatted_title = format_title_for_platform(
-                        "telegram", title_data, show_source=True
-                    )
-                else:
-                    formatted_title = f"{title_data['title']}"
+            batcher.put(word_header + first_news_line, (stats_header,))
 
+            # 处理剩余新闻条目，换批时重复词组标题
+            for j in range(1, len(stat["titles"])):
+                formatted_title = format_batch_title(format_type, stat["titles"][j])
                 news_line = f"  {j + 1}. {formatted_title}\n"
                 if j < len(stat["titles"]) - 1:
                     news_line += "\n"
-
-                test_content = current_batch + news_line
-                if (
-                        len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                        >= max_bytes
-                ):
-                    if current_batch_has_content:
-                        batches.append(current_batch + base_footer)
-                    current_batch = base_header + stats_header + word_header + news_line
-                    current_batch_has_content = True
-                else:
-                    current_batch = test_content
-                    current_batch_has_content = True
+                batcher.put(news_line, (stats_header, word_header))
 
             # 词组间分隔符
             if i < len(report_data["stats"]) - 1:
-                separator = ""
                 if format_type == "wework":
-                    separator = f"\n\n\n\n"
+                    batcher.try_append(f"\n\n\n\n")
                 elif format_type == "telegram":
-                    separator = f"\n\n"
-
-                test_content = current_batch + separator
-                if (
-                        len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                        < max_bytes
-                ):
-                    current_batch = test_content
+                    batcher.try_append(f"\n\n")
 
     # 处理新增新闻（同样确保来源标题+第一条新闻的原子性）
     if report_data["new_titles"]:
@@ -2515,18 +3778,7 @@ def split_content_into_batches(
                 f"\n\n🆕 本次新增热点新闻 (共 {report_data['total_new_count']} 条)\n\n"
             )
 
-        test_content = current_batch + new_header
-        if (
-                len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                >= max_bytes
-        ):
-            if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            current_batch = base_header + new_header
-            current_batch_has_content = True
-        else:
-            current_batch = test_content
-            current_batch_has_content = True
+        batcher.put(new_header)
 
         # 逐个处理新增新闻来源
         for source_data in report_data["new_titles"]:
@@ -2539,74 +3791,23 @@ def split_content_into_batches(
             # 构建第一条新增新闻
             first_news_line = ""
             if source_data["titles"]:
-                first_title_data = source_data["titles"][0]
-                title_data_copy = first_title_data.copy()
-                title_data_copy["is_new"] = False
-
-                if format_type == "wework":
-                    formatted_title = format_title_for_platform(
-                        "wework", title_data_copy, show_source=False
-                    )
-                elif format_type == "telegram":
-                    formatted_title = format_title_for_platform(
-                        "telegram", title_data_copy, show_source=False
-                    )
-                else:
-                    formatted_title = f"{title_data_copy['title']}"
-
+                formatted_title = format_batch_title(
+                    format_type, source_data["titles"][0], show_source=False, is_new=False
+                )
                 first_news_line = f"  1. {formatted_title}\n"
 
             # 原子性检查：来源标题+第一条新闻
-            source_with_first_news = source_header + first_news_line
-            test_content = current_batch + source_with_first_news
-
-            if (
-                    len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                    >= max_bytes
-            ):
-                if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + new_header + source_with_first_news
-                current_batch_has_content = True
-                start_index = 1
-            else:
-                current_batch = test_content
-                current_batch_has_content = True
-                start_index = 1
+            batcher.put(source_header + first_news_line, (new_header,))
 
             # 处理剩余新增新闻
-            for j in range(start_index, len(source_data["titles"])):
-                title_data = source_data["titles"][j]
-                title_data_copy = title_data.copy()
-                title_data_copy["is_new"] = False
-
-                if format_type == "wework":
-                    formatted_title = format_title_for_platform(
-                        "wework", title_data_copy, show_source=False
-                    )
-                elif format_type == "telegram":
-                    formatted_title = format_title_for_platform(
-                        "telegram", title_data_copy, show_source=False
-                    )
-                else:
-                    formatted_title = f"{title_data_copy['title']}"
-
+            for j in range(1, len(source_data["titles"])):
+                formatted_title = format_batch_title(
+                    format_type, source_data["titles"][j], show_source=False, is_new=False
+                )
                 news_line = f"  {j + 1}. {formatted_title}\n"
+                batcher.put(news_line, (new_header, source_header))
 
-                test_content = current_batch + news_line
-                if (
-                        len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                        >= max_bytes
-                ):
-                    if current_batch_has_content:
-                        batches.append(current_batch + base_footer)
-                    current_batch = base_header + new_header + source_header + news_line
-                    current_batch_has_content = True
-                else:
-                    current_batch = test_content
-                    current_batch_has_content = True
-
-            current_batch += "\n"
+            batcher.append("\n")
 
     if report_data["failed_ids"]:
         failed_header = ""
@@ -2615,39 +3816,13 @@ def split_content_into_batches(
         elif format_type == "telegram":
             failed_header = f"\n\n⚠️ 数据获取失败的平台：\n\n"
 
-        test_content = current_batch + failed_header
-        if (
-                len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                >= max_bytes
-        ):
-            if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            current_batch = base_header + failed_header
-            current_batch_has_content = True
-        else:
-            current_batch = test_content
-            current_batch_has_content = True
+        batcher.put(failed_header)
 
         for i, id_value in enumerate(report_data["failed_ids"], 1):
-            failed_line = f"  • {id_value}\n"
-            test_content = current_batch + failed_line
-            if (
-                    len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                    >= max_bytes
-            ):
-                if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + failed_header + failed_line
-                current_batch_has_content = True
-            else:
-                current_batch = test_content
-                current_batch_has_content = True
+            batcher.put(f"  • {id_value}\n", (failed_header,))
 
     # 完成最后批次
-    if current_batch_has_content:
-        batches.append(current_batch + base_footer)
-
-    return batches
+    return batcher.finish()
 
 
 def send_to_webhooks(
@@ -2659,6 +3834,7 @@ def send_to_webhooks(
         update_info: Optional[Dict] = None,
         proxy_url: Optional[str] = None,
         mode: str = "daily",
+        matcher: Optional[WordMatcher] = None,
 ) -> Dict[str, bool]:
     """发送数据到多个webhook平台"""
     results = {}
@@ -2681,7 +3857,9 @@ def send_to_webhooks(
             else:
                 print(f"静默模式：今天首次推送")
 
-    report_data = prepare_report_data(stats, failed_ids, new_titles, id_to_name, mode)
+    report_data = prepare_report_data(
+        stats, failed_ids, new_titles, id_to_name, mode, matcher
+    )
 
     feishu_url = CONFIG["FEISHU_WEBHOOK_URL"]
     dingtalk_url = CONFIG["DINGTALK_WEBHOOK_URL"]
@@ -2690,37 +3868,28 @@ def send_to_webhooks(
     telegram_chat_id = CONFIG["TELEGRAM_CHAT_ID"]
 
     update_info_to_send = update_info if CONFIG["SHOW_VERSION_UPDATE"] else None
+    common_args = (report_data, report_type, update_info_to_send, proxy_url, mode)
 
-    # 发送到飞书
+    # 各渠道（飞书、钉钉、企业微信、Telegram）并发发送；
+    # 渠道内部仍按顺序逐批发送并保留批次间隔，总耗时接近最慢的单个渠道
+    channels = []
     if feishu_url:
-        results["feishu"] = send_to_feishu(
-            feishu_url, report_data, report_type, update_info_to_send, proxy_url, mode
-        )
-
-    # 发送到钉钉
+        channels.append(("feishu", send_to_feishu, (feishu_url, *common_args)))
     if dingtalk_url:
-        results["dingtalk"] = send_to_dingtalk(
-            dingtalk_url, report_data, report_type, update_info_to_send, proxy_url, mode
-        )
-
-    # 发送到企业微信
+        channels.append(("dingtalk", send_to_dingtalk, (dingtalk_url, *common_args)))
     if wework_url:
-        results["wework"] = send_to_wework(
-            wework_url, report_data, report_type, update_info_to_send, proxy_url, mode
-        )
-
-    # 发送到 Telegram
+        channels.append(("wework", send_to_wework, (wework_url, *common_args)))
     if telegram_token and telegram_chat_id:
-        results["telegram"] = send_to_telegram(
-            telegram_token,
-            telegram_chat_id,
-            report_data,
-            report_type,
-            update_info_to_send,
-            proxy_url,
-            mode,
+        channels.append(
+            ("telegram", send_to_telegram, (telegram_token, telegram_chat_id, *common_args))
         )
 
+    if channels:
+        with ThreadPoolExecutor(max_workers=len(channels)) as executor:
+            futures = [executor.submit(sender, *args) for _, sender, args in channels]
+        for (name, _, _), future in zip(channels, futures):
+            results[name] = future.result()
+
     if not results:
         print("未配置任何webhook URL，跳过通知发送")
 
@@ -2759,13 +3928,13 @@ def send_to_feishu(
         },
     }
 
-    proxies = None
-    if proxy_url:
-        proxies = {"http": proxy_url, "https": proxy_url}
-
     try:
-        response = requests.post(
-            webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
+        response = HTTP_CLIENT.post(
+            webhook_url,
+            headers=headers,
+            json=payload,
+            proxy_url=proxy_url,
+            timeout=CONFIG["HTTP"]["WEBHOOK_TIMEOUT"],
         )
         if response.status_code == 200:
             print(f"飞书通知发送成功 [{report_type}]")
@@ -2799,13 +3968,13 @@ def send_to_dingtalk(
         },
     }
 
-    proxies = None
-    if proxy_url:
-        proxies = {"http": proxy_url, "https": proxy_url}
-
     try:
-        response = requests.post(
-            webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
+        response = HTTP_CLIENT.post(
+            webhook_url,
+            headers=headers,
+            json=payload,
+            proxy_url=proxy_url,
+            timeout=CONFIG["HTTP"]["WEBHOOK_TIMEOUT"],
         )
         if response.status_code == 200:
             result = response.json()
@@ -2833,10 +4002,6 @@ def send_to_wework(
 ) -> bool:
     """发送到企业微信（支持分批发送）"""
     headers = {"Content-Type": "application/json"}
-    proxies = None
-    if proxy_url:
-        proxies = {"http": proxy_url, "https": proxy_url}
-
     # 获取分批内容
     batches = split_content_into_batches(report_data, "wework", update_info, mode=mode)
 
@@ -2857,8 +4022,12 @@ def send_to_wework(
         payload = {"msgtype": "markdown", "markdown": {"content": batch_content}}
 
         try:
-            response = requests.post(
-                webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
+            response = HTTP_CLIENT.post(
+                webhook_url,
+                headers=headers,
+                json=payload,
+                proxy_url=proxy_url,
+                timeout=CONFIG["HTTP"]["WEBHOOK_TIMEOUT"],
             )
             if response.status_code == 200:
                 result = response.json()
@@ -2898,10 +4067,6 @@ def send_to_telegram(
     headers = {"Content-Type": "application/json"}
     url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
 
-    proxies = None
-    if proxy_url:
-        proxies = {"http": proxy_url, "https": proxy_url}
-
     # 获取分批内容
     batches = split_content_into_batches(
         report_data, "telegram", update_info, mode=mode
@@ -2929,8 +4094,12 @@ def send_to_telegram(
         }
 
         try:
-            response = requests.post(
-                url, headers=headers, json=payload, proxies=proxies, timeout=30
+            response = HTTP_CLIENT.post(
+                url,
+                headers=headers,
+                json=payload,
+                proxy_url=proxy_url,
+                timeout=CONFIG["HTTP"]["WEBHOOK_TIMEOUT"],
             )
             if response.status_code == 200:
                 result = response.json()
@@ -2958,6 +4127,25 @@ def send_to_telegram(
 
 
 # === 主分析器 ===
+@dataclass
+class RunContext:
+    """单次运行的共享上下文：抓取结果、当日聚合和新增标题只计算一次"""
+
+    results: Dict
+    id_to_name: Dict
+    failed_ids: List
+    time_info: str
+    platform_ids: List[str]
+    crawled_failed_ids: List
+    word_groups: List[Dict]
+    filter_words: List[str]
+    matcher: WordMatcher
+    new_titles: Dict = field(default_factory=dict)
+    analysis_data: Optional[Tuple] = None
+    # (数据名, 模式) -> (stats, total_titles)，数据名由调用方显式给出，如 "analysis"
+    stats_cache: Dict = field(default_factory=dict)
+
+
 class NewsAnalyzer:
     """新闻分析器"""
 
@@ -3033,6 +4221,8 @@ class NewsAnalyzer:
         else:
             print("GitHub Actions环境，不使用代理")
 
+        HTTP_CLIENT.set_proxy(self.proxy_url)
+
     def _check_version_update(self) -> None:
         """检查版本更新"""
         try:
@@ -3082,39 +4272,36 @@ class NewsAnalyzer:
             return has_matched_news or has_new_news
 
     def _load_analysis_data(
-            self,
+            self, ctx: RunContext
     ) -> Optional[Tuple[Dict, Dict, Dict, Dict, List, List]]:
-        """统一的数据加载和预处理，使用当前监控平台列表过滤历史数据"""
-        try:
-            # 获取当前配置的监控平台ID列表
-            current_platform_ids = []
-            for platform in CONFIG["PLATFORMS"]:
-                current_platform_ids.append(platform["id"])
+        """统一的数据加载和预处理，使用当前监控平台列表过滤历史数据（每次运行只加载一次）"""
+        if ctx.analysis_data is not None:
+            return ctx.analysis_data or None
 
-            print(f"当前监控平台: {current_platform_ids}")
+        try:
+            print(f"当前监控平台: {ctx.platform_ids}")
 
             all_results, id_to_name, title_info = read_all_today_titles(
-                current_platform_ids
+                ctx.platform_ids
             )
 
             if not all_results:
                 print("没有找到当天的数据")
+                ctx.analysis_data = ()
                 return None
 
             total_titles = sum(len(titles) for titles in all_results.values())
             print(f"读取到 {total_titles} 个标题（已按当前监控平台过滤）")
 
-            new_titles = detect_latest_new_titles(current_platform_ids)
-            word_groups, filter_words = load_frequency_words()
-
-            return (
+            ctx.analysis_data = (
                 all_results,
                 id_to_name,
                 title_info,
-                new_titles,
-                word_groups,
-                filter_words,
+                ctx.new_titles,
+                ctx.word_groups,
+                ctx.filter_words,
             )
+            return ctx.analysis_data
         except Exception as e:
             print(f"数据加载失败: {e}")
             return None
@@ -3150,20 +4337,33 @@ class NewsAnalyzer:
             id_to_name: Dict,
             failed_ids: Optional[List] = None,
             is_daily_summary: bool = False,
+            ctx: Optional[RunContext] = None,
+            stats_key: Optional[str] = None,
     ) -> Tuple[List[Dict], str]:
-        """统一的分析流水线：数据处理 → 统计计算 → HTML生成"""
+        """
+        统一的分析流水线：数据处理 → 统计计算 → HTML生成
+        stats_key 标识本次运行中的同一份输入数据（如 ctx.analysis_data 对应 "analysis"），
+        给出时同一数据和模式的统计结果缓存在 ctx 上只计算一次
+        """
 
         # 统计计算
-        stats, total_titles = count_word_frequency(
-            data_source,
-            word_groups,
-            filter_words,
-            id_to_name,
-            title_info,
-            self.rank_threshold,
-            new_titles,
-            mode=mode,
-        )
+        cache_key = (stats_key, mode)
+        if ctx is not None and stats_key is not None and cache_key in ctx.stats_cache:
+            stats, total_titles = ctx.stats_cache[cache_key]
+        else:
+            stats, total_titles = count_word_frequency(
+                data_source,
+                word_groups,
+                filter_words,
+                id_to_name,
+                title_info,
+                self.rank_threshold,
+                new_titles,
+                mode=mode,
+                matcher=ctx.matcher if ctx is not None else None,
+            )
+            if ctx is not None and stats_key is not None:
+                ctx.stats_cache[cache_key] = (stats, total_titles)
 
         # HTML生成
         html_file = generate_html_report(
@@ -3174,6 +4374,7 @@ class NewsAnalyzer:
             id_to_name=id_to_name,
             mode=mode,
             is_daily_summary=is_daily_summary,
+            matcher=ctx.matcher if ctx is not None else None,
         )
 
         return stats, html_file
@@ -3186,6 +4387,7 @@ class NewsAnalyzer:
             failed_ids: Optional[List] = None,
             new_titles: Optional[Dict] = None,
             id_to_name: Optional[Dict] = None,
+            matcher: Optional[WordMatcher] = None,
     ) -> bool:
         """统一的通知发送逻辑，包含所有判断条件"""
         has_webhook = self._has_webhook_configured()
@@ -3204,6 +4406,7 @@ class NewsAnalyzer:
                 self.update_info,
                 self.proxy_url,
                 mode=mode,
+                matcher=matcher,
             )
             return True
         elif CONFIG["ENABLE_NOTIFICATION"] and not has_webhook:
@@ -3227,7 +4430,9 @@ class NewsAnalyzer:
 
         return False
 
-    def _generate_summary_report(self, mode_strategy: Dict) -> Optional[str]:
+    def _generate_summary_report(
+            self, mode_strategy: Dict, ctx: RunContext
+    ) -> Optional[str]:
         """生成汇总报告（带通知）"""
         summary_type = (
             "当前榜单汇总" if mode_strategy["summary_mode"] == "current" else "当日汇总"
@@ -3235,7 +4440,7 @@ class NewsAnalyzer:
         print(f"生成{summary_type}报告...")
 
         # 加载分析数据
-        analysis_data = self._load_analysis_data()
+        analysis_data = self._load_analysis_data(ctx)
         if not analysis_data:
             return None
 
@@ -3253,6 +4458,8 @@ class NewsAnalyzer:
             filter_words,
             id_to_name,
             is_daily_summary=True,
+            ctx=ctx,
+            stats_key="analysis",
         )
 
         print(f"{summary_type}报告已生成: {html_file}")
@@ -3264,17 +4471,20 @@ class NewsAnalyzer:
             mode_strategy["summary_mode"],
             new_titles=new_titles,
             id_to_name=id_to_name,
+            matcher=ctx.matcher,
         )
 
         return html_file
 
-    def _generate_summary_html(self, mode: str = "daily") -> Optional[str]:
+    def _generate_summary_html(
+            self, ctx: RunContext, mode: str = "daily"
+    ) -> Optional[str]:
         """生成汇总HTML"""
         summary_type = "当前榜单汇总" if mode == "current" else "当日汇总"
         print(f"生成{summary_type}HTML...")
 
         # 加载分析数据
-        analysis_data = self._load_analysis_data()
+        analysis_data = self._load_analysis_data(ctx)
         if not analysis_data:
             return None
 
@@ -3292,6 +4502,8 @@ class NewsAnalyzer:
             filter_words,
             id_to_name,
             is_daily_summary=True,
+            ctx=ctx,
+            stats_key="analysis",
         )
 
         print(f"{summary_type}HTML已生成: {html_file}")
@@ -3318,53 +4530,88 @@ class NewsAnalyzer:
         print(f"报告模式: {self.report_mode}")
         print(f"运行模式: {mode_strategy['description']}")
 
-    def _crawl_data(self) -> Tuple[Dict, Dict, List]:
-        """执行数据爬取"""
+    def _crawl_data(self) -> RunContext:
+        """执行数据爬取，保存快照并计算本批次新增标题
+
+        监控平台与 API_IDS 合并为一次抓取，API 生成阶段直接复用本次快照
+        """
         ids = []
         for platform in CONFIG["PLATFORMS"]:
             if "name" in platform:
                 ids.append((platform["id"], platform["name"]))
             else:
                 ids.append(platform["id"])
+        platform_ids = [platform["id"] for platform in CONFIG["PLATFORMS"]]
+
+        api_only_ids = [item for item in API_IDS if item[0] not in platform_ids]
+        if api_only_ids:
+            print(f"API 额外数据源: {[item[1] for item in api_only_ids]}")
 
         print(
             f"配置的监控平台: {[p.get('name', p['id']) for p in CONFIG['PLATFORMS']]}"
         )
-        print(f"开始爬取数据，请求间隔 {self.request_interval} 毫秒")
+        print(
+            f"开始爬取数据，并发数 {CONFIG['MAX_WORKERS']}，同一主机请求间隔 {self.request_interval} 毫秒"
+        )
         ensure_directory_exists("output")
 
         results, id_to_name, failed_ids = self.data_fetcher.crawl_websites(
-            ids, self.request_interval
+            ids + api_only_ids, self.request_interval
         )
 
-        title_file = save_titles_to_file(results, id_to_name, failed_ids)
-        print(f"标题已保存到: {title_file}")
+        time_info = save_snapshot(results, id_to_name, failed_ids)
+        self.data_fetcher.save_response_cache()
+        print(f"快照已保存到: {SnapshotStore().path} ({time_info})")
 
-        return results, id_to_name, failed_ids
+        word_groups, filter_words, matcher = load_frequency_words()
+        return RunContext(
+            results={
+                source_id: titles
+                for source_id, titles in results.items()
+                if source_id in platform_ids
+            },
+            id_to_name={
+                source_id: name
+                for source_id, name in id_to_name.items()
+                if source_id in platform_ids
+            },
+            failed_ids=[
+                source_id for source_id in failed_ids if source_id in platform_ids
+            ],
+            time_info=time_info,
+            platform_ids=platform_ids,
+            crawled_failed_ids=failed_ids,
+            word_groups=word_groups,
+            filter_words=filter_words,
+            matcher=matcher,
+            new_titles=detect_latest_new_titles(
+                platform_ids, self.data_fetcher.unchanged_ids
+            ),
+        )
 
     def _execute_mode_strategy(
-            self, mode_strategy: Dict, results: Dict, id_to_name: Dict, failed_ids: List
+            self, mode_strategy: Dict, ctx: RunContext
     ) -> Optional[str]:
         """执行模式特定逻辑"""
-        # 获取当前监控平台ID列表
-        current_platform_ids = [platform["id"] for platform in CONFIG["PLATFORMS"]]
-
-        new_titles = detect_latest_new_titles(current_platform_ids)
-        time_info = Path(save_titles_to_file(results, id_to_name, failed_ids)).stem
-        word_groups, filter_words = load_frequency_words()
+        results = ctx.results
+        id_to_name = ctx.id_to_name
+        failed_ids = ctx.failed_ids
+        new_titles = ctx.new_titles
+        word_groups = ctx.word_groups
+        filter_words = ctx.filter_words
 
         # current模式下，实时推送需要使用完整的历史数据来保证统计信息的完整性
         if self.report_mode == "current":
             # 加载完整的历史数据（已按当前平台过滤）
-            analysis_data = self._load_analysis_data()
+            analysis_data = self._load_analysis_data(ctx)
             if analysis_data:
                 (
                     all_results,
                     historical_id_to_name,
                     historical_title_info,
                     historical_new_titles,
-                    _,
-                    _,
+                    word_groups,
+                    filter_words,
                 ) = analysis_data
 
                 print(
@@ -3380,6 +4627,8 @@ class NewsAnalyzer:
                     filter_words,
                     historical_id_to_name,
                     failed_ids=failed_ids,
+                    ctx=ctx,
+                    stats_key="analysis",
                 )
 
                 combined_id_to_name = {**historical_id_to_name, **id_to_name}
@@ -3396,12 +4645,13 @@ class NewsAnalyzer:
                         failed_ids=failed_ids,
                         new_titles=historical_new_titles,
                         id_to_name=combined_id_to_name,
+                        matcher=ctx.matcher,
                     )
             else:
                 print("❌ 严重错误：无法读取刚保存的数据文件")
                 raise RuntimeError("数据一致性检查失败：保存后立即读取失败")
         else:
-            title_info = self._prepare_current_title_info(results, time_info)
+            title_info = self._prepare_current_title_info(results, ctx.time_info)
             stats, html_file = self._run_analysis_pipeline(
                 results,
                 self.report_mode,
@@ -3424,6 +4674,7 @@ class NewsAnalyzer:
                     failed_ids=failed_ids,
                     new_titles=new_titles,
                     id_to_name=id_to_name,
+                    matcher=ctx.matcher,
                 )
 
         # 生成汇总报告（如果需要）
@@ -3432,11 +4683,11 @@ class NewsAnalyzer:
             if mode_strategy["should_send_realtime"]:
                 # 如果已经发送了实时通知，汇总只生成HTML不发送通知
                 summary_html = self._generate_summary_html(
-                    mode_strategy["summary_mode"]
+                    ctx, mode_strategy["summary_mode"]
                 )
             else:
                 # daily模式：直接生成汇总报告并发送通知
-                summary_html = self._generate_summary_report(mode_strategy)
+                summary_html = self._generate_summary_report(mode_strategy, ctx)
 
         # 打开浏览器（仅在非容器环境）
         if self._should_open_browser() and html_file:
@@ -3463,14 +4714,14 @@ class NewsAnalyzer:
 
             mode_strategy = self._get_mode_strategy()
 
-            results, id_to_name, failed_ids = self._crawl_data()
+            ctx = self._crawl_data()
 
-            summary_html_path = self._execute_mode_strategy(
-                mode_strategy, results, id_to_name, failed_ids
-            )
+            summary_html_path = self._execute_mode_strategy(mode_strategy, ctx)
 
-            # 运行结束后，生成静态API文件和关联的图片
-            generate_static_api_files(self)
+            # 运行结束后，复用本次抓取生成静态API文件和关联的图片
+            generate_static_api_files(self, ctx)
+
+            HTTP_CLIENT.log_connection_stats()
 
         except Exception as e:
             print(f"分析流程执行出错: {e}")
@@ -3490,25 +4741,47 @@ API_IDS = [
 
 def generate_api_data(
     analyzer: "NewsAnalyzer",
+    ctx: Optional[RunContext] = None,
 ) -> Tuple[Dict, List, int, List, Dict]:
     """
     获取并分析来自固定源的趋势数据，返回API所需的所有数据。
+    传入 ctx 时复用主流程已保存的快照，不再重复爬取。
     """
     print("为API生成数据：开始获取和分析...")
 
-    # 1. 爬取数据
-    results, id_to_name, failed_ids = analyzer.data_fetcher.crawl_websites(
-        API_IDS, analyzer.request_interval
-    )
-
-    # 2. 保存原始数据（可选，但保持与主流程一致）
-    save_titles_to_file(results, id_to_name, failed_ids)
-
-    # 3. 分析数据
     api_id_list = [
         item[0] if isinstance(item, tuple) else item for item in API_IDS
     ]
+
+    if ctx is not None:
+        failed_ids = [
+            source_id for source_id in ctx.crawled_failed_ids if source_id in api_id_list
+        ]
+        word_groups, filter_words, matcher = (
+            ctx.word_groups,
+            ctx.filter_words,
+            ctx.matcher,
+        )
+    else:
+        # 1. 爬取数据
+        results, id_to_name, failed_ids = analyzer.data_fetcher.crawl_websites(
+            API_IDS, analyzer.request_interval
+        )
+
+        # 2. 保存原始数据（可选，但保持与主流程一致）
+        save_snapshot(results, id_to_name, failed_ids)
+        analyzer.data_fetcher.save_response_cache()
+        word_groups, filter_words, matcher = load_frequency_words()
+
+    # 3. 分析数据
     all_results, final_id_to_name, title_info = read_all_today_titles(api_id_list)
+    if ctx is not None:
+        # 合并抓取时重叠平台以监控配置的名称保存，API 仍沿用固定的来源名称
+        api_names = dict(item for item in API_IDS if isinstance(item, tuple))
+        final_id_to_name = {
+            source_id: api_names.get(source_id, name)
+            for source_id, name in final_id_to_name.items()
+        }
 
     if not all_results:
         empty_response = {
@@ -3519,8 +4792,9 @@ def generate_api_data(
         }
         return empty_response, [], 0, failed_ids, {}
 
-    new_titles = detect_latest_new_titles(api_id_list)
-    word_groups, filter_words = load_frequency_words()
+    new_titles = detect_latest_new_titles(
+        api_id_list, analyzer.data_fetcher.unchanged_ids
+    )
 
     stats, total_titles = count_word_frequency(
         all_results,
@@ -3531,6 +4805,7 @@ def generate_api_data(
         analyzer.rank_threshold,
         new_titles,
         mode="daily",  # API通常提供当日汇总数据
+        matcher=matcher,
     )
 
     # 4. 格式化为API响应结构
@@ -3565,7 +4840,9 @@ def generate_api_data(
     return api_response, stats, total_titles, failed_ids, final_id_to_name
 
 
-def generate_static_api_files(analyzer: "NewsAnalyzer"):
+def generate_static_api_files(
+    analyzer: "NewsAnalyzer", ctx: Optional[RunContext] = None
+):
     """
     获取趋势数据，生成HTML报告和图片，并将其保存为静态的 JSON 文件。
     """
@@ -3575,9 +4852,10 @@ def generate_static_api_files(analyzer: "NewsAnalyzer"):
         total_titles,
         failed_ids,
         id_to_name,
-    ) = generate_api_data(analyzer)
+    ) = generate_api_data(analyzer, ctx)
 
-    # 生成与API数据关联的HTML报告
+    # 生成与API数据关联的HTML报告，同时保留渲染结果用于截图
+    html_parts = []
     api_html_report_path = generate_html_report(
         stats,
         total_titles,
@@ -3585,12 +4863,15 @@ def generate_static_api_files(analyzer: "NewsAnalyzer"):
         id_to_name=id_to_name,
         mode="daily",
         is_daily_summary=True,
+        html_parts=html_parts,
     )
     print(f"为API数据生成了HTML报告: {api_html_report_path}")
 
-    # 从该HTML报告生成图片
+    # 从该HTML报告生成图片（报告样式全部内联，不依赖外部资源）
     image_path = "img/news.jpg"
-    generate_image_from_html(api_html_report_path, image_path)
+    generate_image_from_html(
+        api_html_report_path, image_path, wait=False, html="".join(html_parts)
+    )
 
     # 将图片链接添加到API数据中
     base_url = CONFIG.get("BASE_URL", "").rstrip("/")
@@ -3605,37 +4886,203 @@ def generate_static_api_files(analyzer: "NewsAnalyzer"):
     output_dir = Path(output_path).parent
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    with open(output_path, "w", encoding="utf-8") as f:
+    # 先写临时文件再原子替换，API 服务不会读到写了一半的文件
+    tmp_path = f"{output_path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
         json.dump(api_data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, output_path)
 
     print(f"静态API文件已成功生成: {output_path}")
 
 
+class TrendsSnapshot:
+    """trends.json 的内存快照
+
+    请求只读取内存中的响应体（附带 ETag/Last-Modified 与预压缩的 gzip 版本），
+    由单个后台线程按计划重建；并发的刷新请求合并为一次。
+    按需刷新（refresh_async）与上一次开始刷新至少间隔 min_interval 秒，
+    首次生成失败时请求也不会反复触发抓取。
+    """
+
+    def __init__(self, path: str = "api/trends.json", min_interval: int = 300):
+        self.path = Path(path)
+        self.min_interval = min_interval
+        self._last_started = 0.0
+        self._entry = None
+        self._file_key = None
+        self._refresh_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def load(self) -> bool:
+        """从磁盘加载 trends.json，文件未变化时不重复加载"""
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return False
+
+        file_key = (stat.st_mtime_ns, stat.st_size)
+        if file_key == self._file_key:
+            return True
+
+        body = self.path.read_bytes()
+        # 整体替换元组，读取方无需加锁
+        self._entry = (
+            body,
+            gzip.compress(body),
+            f'"{hashlib.sha1(body).hexdigest()}"',
+            formatdate(stat.st_mtime, usegmt=True),
+        )
+        self._file_key = file_key
+        return True
+
+    def current(self) -> Optional[Tuple[bytes, bytes, str, str]]:
+        """返回 (body, gzip_body, etag, last_modified)，尚未生成时为 None"""
+        return self._entry
+
+    @property
+    def refreshing(self) -> bool:
+        return self._refresh_lock.locked()
+
+    def refresh(self, wait: bool = True) -> bool:
+        """重新生成 trends.json 并加载
+
+        已有刷新在进行时不再重复生成：wait 为真则等待其完成，否则立即返回 False
+        """
+        if not self._refresh_lock.acquire(blocking=False):
+            if wait:
+                with self._refresh_lock:
+                    pass
+            return False
+
+        self._last_started = time.time()
+        try:
+            generate_static_api_files(NewsAnalyzer())
+            self.load()
+            return True
+        except Exception as e:
+            print(f"API 数据刷新失败: {e}")
+            return False
+        finally:
+            self._refresh_lock.release()
+
+    def retry_after(self) -> int:
+        """距离允许下一次按需刷新的秒数"""
+        return max(0, int(self._last_started + self.min_interval - time.time()) + 1)
+
+    def refresh_async(self) -> bool:
+        """在后台线程中刷新；已有刷新在进行或距上次刷新不足 min_interval 时返回 False"""
+        if self.refreshing or time.time() - self._last_started < self.min_interval:
+            return False
+        threading.Thread(
+            target=self.refresh, kwargs={"wait": False}, daemon=True
+        ).start()
+        return True
+
+    def start(self, interval: int) -> None:
+        """加载现有快照并启动定时刷新线程（interval 为 0 时不定时刷新）"""
+        if not self.load():
+            self.refresh_async()
+        if interval <= 0 or self._thread is not None:
+            return
+
+        def loop():
+            while not self._stop.wait(interval):
+                self.refresh(wait=False)
+
+        self._thread = threading.Thread(target=loop, daemon=True)
+        self._thread.start()
+        print(f"API 数据后台刷新间隔: {interval} 秒")
+
+    def stop(self) -> None:
+        self._stop.set()
+
+
+TRENDS_SNAPSHOT = TrendsSnapshot(min_interval=CONFIG["API"]["MIN_REFRESH_INTERVAL"])
+
+
 # --- Flask App (如果已安装) ---
 if FLASK_AVAILABLE:
     app = Flask(__name__)
 
+    def _not_modified(etag: str, last_modified: str) -> bool:
+        """检查条件请求头，If-None-Match 优先于 If-Modified-Since"""
+        if_none_match = request.headers.get("If-None-Match")
+        if if_none_match:
+            return if_none_match.strip() == "*" or etag in [
+                tag.strip() for tag in if_none_match.split(",")
+            ]
+
+        if_modified_since = request.headers.get("If-Modified-Since")
+        if if_modified_since:
+            try:
+                return parsedate_to_datetime(
+                    if_modified_since
+                ) >= parsedate_to_datetime(last_modified)
+            except (TypeError, ValueError):
+                return False
+        return False
+
     @app.route('/api/trends.json')
     @app.route('/api/trends')
     def get_trends():
         """
-        API端点，实时生成并返回趋势数据。
-        注意：这是一个耗时操作，每次请求都会重新爬取、分析和渲染图片。
+        API端点，返回内存中预先生成的趋势数据。
+        数据由后台线程定期刷新，请求本身不会触发爬取或渲染。
         """
-        try:
-            analyzer = NewsAnalyzer()
-            # 运行完整的静态文件生成流程
-            generate_static_api_files(analyzer)
-            # 读取刚刚生成的文件并返回
-            api_file = Path("api/trends.json")
-            if api_file.exists():
-                with open(api_file, "r", encoding="utf-8") as f:
-                    return jsonify(json.load(f))
-            else:
-                return jsonify({"error": "API文件生成失败"}), 500
-        except Exception as e:
-            print(f"API请求处理失败: {e}")
-            return jsonify({"error": "内部服务器错误", "message": str(e)}), 500
+        entry = TRENDS_SNAPSHOT.current()
+        if entry is None:
+            # 尚无任何快照（首次生成由启动时的后台刷新完成），不在请求中抓取
+            TRENDS_SNAPSHOT.refresh_async()
+            retry_after = 30 if TRENDS_SNAPSHOT.refreshing else TRENDS_SNAPSHOT.retry_after()
+            return (
+                jsonify({"error": "API数据尚未生成"}),
+                503,
+                {"Retry-After": str(retry_after)},
+            )
+
+        body, gzip_body, etag, last_modified = entry
+        headers = {
+            "ETag": etag,
+            "Last-Modified": last_modified,
+            "Cache-Control": "no-cache",
+            "Vary": "Accept-Encoding",
+        }
+        if _not_modified(etag, last_modified):
+            return Response(status=304, headers=headers)
+
+        # 按 q 值解析，gzip;q=0 表示客户端拒绝 gzip
+        if request.accept_encodings["gzip"] > 0:
+            headers["Content-Encoding"] = "gzip"
+            body = gzip_body
+        return Response(body, mimetype="application/json", headers=headers)
+
+    def _refresh_allowed() -> bool:
+        """配置了 refresh_token 时校验 X-Refresh-Token 请求头，否则只允许本机访问"""
+        token = CONFIG["API"]["REFRESH_TOKEN"]
+        if token:
+            # 按字节比较：compare_digest 不接受非 ASCII 的 str
+            return hmac.compare_digest(
+                request.headers.get("X-Refresh-Token", "").encode("utf-8"),
+                token.encode("utf-8"),
+            )
+        return request.remote_addr in ("127.0.0.1", "::1")
+
+    @app.route('/api/trends/refresh', methods=['POST'])
+    def refresh_trends():
+        """触发一次后台刷新：已有刷新在进行时合并，距上次刷新不足最小间隔时拒绝"""
+        if not _refresh_allowed():
+            return jsonify({"error": "forbidden"}), 403
+        if TRENDS_SNAPSHOT.refreshing:
+            return jsonify({"refreshing": True, "started": False}), 202
+        if not TRENDS_SNAPSHOT.refresh_async():
+            retry_after = TRENDS_SNAPSHOT.retry_after()
+            return (
+                jsonify({"error": "refresh too frequent", "retry_after": retry_after}),
+                429,
+                {"Retry-After": str(retry_after)},
+            )
+        return jsonify({"refreshing": True, "started": True}), 202
 
     @app.route('/img/<path:filename>')
     def serve_image(filename):
@@ -3643,6 +5090,139 @@ if FLASK_AVAILABLE:
         return send_from_directory('img', filename)
 
 
+# === 常驻调度 ===
+class DaemonScheduler:
+    """常驻进程调度器
+
+    进程内每隔 interval 秒执行一轮 NewsAnalyzer.run（抓取、报告、推送），
+    配置、连接池与当日聚合在各轮之间保留；报告与推送频率只由 interval 决定。
+    source_intervals 只能把单个平台的抓取放慢（取值不小于 interval，更小的值按 interval 处理）：
+    未到时间的平台本轮复用响应缓存中的当天标题，不发起请求，因此需要启用 response_cache。
+    收到 SIGTERM/SIGINT 后等待当前一轮结束再退出。
+    """
+
+    def __init__(
+            self,
+            analyzer: "NewsAnalyzer",
+            interval: int,
+            source_intervals: Optional[Dict[str, int]] = None,
+            status_file: str = "output/.daemon_status.json",
+    ):
+        self.analyzer = analyzer
+        self.interval = max(1, int(interval))
+        self.source_intervals = {}
+        for source_id, value in (source_intervals or {}).items():
+            value = int(value)
+            if value < self.interval:
+                print(
+                    f"平台 {source_id} 的抓取间隔 {value} 秒小于调度间隔 {self.interval} 秒，按 {self.interval} 秒处理"
+                )
+                value = self.interval
+            self.source_intervals[source_id] = value
+        self.status_path = Path(status_file)
+        self.stop_event = threading.Event()
+        self.last_fetch = {}
+        self.status = {
+            "pid": os.getpid(),
+            "started_at": get_beijing_time().isoformat(),
+            "interval": self.interval,
+            "source_intervals": self.source_intervals,
+            "runs": 0,
+            "failures": 0,
+            "state": "starting",
+            "last_run_started": None,
+            "last_run_finished": None,
+            "last_duration": None,
+            "last_error": None,
+            "next_run_at": None,
+        }
+
+    def _crawl_ids(self) -> List[str]:
+        ids = [platform["id"] for platform in CONFIG["PLATFORMS"]]
+        ids += [item[0] for item in API_IDS if item[0] not in ids]
+        return ids
+
+    def _source_interval(self, source_id: str) -> int:
+        return self.source_intervals.get(source_id, self.interval)
+
+    def _deferred_ids(self, now: float) -> set:
+        """本轮尚未到抓取时间的平台（留 1 秒余量，避免调度抖动导致整轮错过）"""
+        return {
+            source_id
+            for source_id in self._crawl_ids()
+            if source_id in self.last_fetch
+            and now - self.last_fetch[source_id] < self._source_interval(source_id) - 1
+        }
+
+    def _write_status(self) -> None:
+        try:
+            self.status_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.status_path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.status, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.status_path)
+        except Exception as e:
+            print(f"写入调度状态失败: {e}")
+
+    def _handle_signal(self, signum, frame) -> None:
+        print(f"收到信号 {signal.Signals(signum).name}，当前任务结束后退出")
+        self.stop_event.set()
+
+    def run_once(self) -> None:
+        """执行一轮分析，失败只记录不退出"""
+        started = time.time()
+        deferred_ids = self._deferred_ids(started)
+        self.analyzer.data_fetcher.deferred_ids = deferred_ids
+
+        self.status.update(
+            state="running",
+            last_run_started=get_beijing_time().isoformat(),
+        )
+        self._write_status()
+        try:
+            self.analyzer.run()
+            self.status["last_error"] = None
+        except Exception as e:
+            self.status["failures"] += 1
+            self.status["last_error"] = str(e)
+        finally:
+            for source_id in self._crawl_ids():
+                if source_id not in deferred_ids:
+                    self.last_fetch[source_id] = started
+            self.status.update(
+                runs=self.status["runs"] + 1,
+                last_run_finished=get_beijing_time().isoformat(),
+                last_duration=round(time.time() - started, 1),
+            )
+
+    def run_forever(self) -> None:
+        signal.signal(signal.SIGTERM, self._handle_signal)
+        signal.signal(signal.SIGINT, self._handle_signal)
+
+        tick = self.interval
+        print(f"常驻模式启动：每 {tick} 秒执行一轮抓取、报告与推送")
+        if self.source_intervals:
+            print(f"按平台放慢抓取: {self.source_intervals}")
+            if not CONFIG["USE_RESPONSE_CACHE"]:
+                print("警告：未启用 response_cache，按平台设置的抓取间隔不会生效")
+
+        while not self.stop_event.is_set():
+            self.run_once()
+            next_run = time.time() + tick
+            self.status.update(
+                state="idle",
+                next_run_at=datetime.fromtimestamp(
+                    next_run, pytz.timezone("Asia/Shanghai")
+                ).isoformat(),
+            )
+            self._write_status()
+            self.stop_event.wait(max(0.0, next_run - time.time()))
+
+        self.status.update(state="stopped", next_run_at=None)
+        self._write_status()
+        print("常驻模式已退出")
+
+
 def main():
     parser = argparse.ArgumentParser(description="TrendRadar: 新闻热点分析工具。")
     parser.add_argument(
@@ -3655,6 +5235,11 @@ def main():
         action='store_true',
         help='仅生成静态的 trends.json, news.jpg 和相关HTML文件并退出'
     )
+    parser.add_argument(
+        '--daemon',
+        action='store_true',
+        help='以常驻模式运行，按 config.yaml 中 daemon 配置的间隔在进程内定时执行'
+    )
     args = parser.parse_args()
 
     try:
@@ -3664,7 +5249,8 @@ def main():
                 print("请运行 'pip install Flask' 来安装。")
                 return
             print("以API服务器模式启动...")
-            app.run(host='0.0.0.0', port=5001, debug=False)
+            TRENDS_SNAPSHOT.start(CONFIG["API"]["REFRESH_INTERVAL"])
+            app.run(host='0.0.0.0', port=5001, debug=False, threaded=True)
 
         elif args.generate_json:
             print("仅生成静态API文件...")
@@ -3672,6 +5258,15 @@ def main():
             generate_static_api_files(analyzer)
             print("文件生成完毕。")
 
+        elif args.daemon:
+            print("以常驻调度模式运行...")
+            DaemonScheduler(
+                NewsAnalyzer(),
+                CONFIG["DAEMON"]["INTERVAL"],
+                CONFIG["DAEMON"]["SOURCE_INTERVALS"],
+                CONFIG["DAEMON"]["STATUS_FILE"],
+            ).run_forever()
+
         else:
             print("以单次脚本模式运行...")
             analyzer = NewsAnalyzer()
@@ -0,0 +1,171 @@
+# tools/bench_aggregator.py
+# 作用：聚合器算法的基准测试与等价性校验（合成数据，不访问网络）
+#   python tools/bench_aggregator.py heat     # 相似标题计数：两两比对 vs 稀疏相似度连接
+#   python tools/bench_aggregator.py cluster  # 贪心聚类：逐簇比对 vs 倒排索引（合成 20k 条/天）
+#   python tools/bench_aggregator.py kmeans   # 主题聚类：自动选 k，达到 MINIBATCH_MIN 条时改用 MiniBatchKMeans
+#
+# 两两比对在 10k/50k 规模下耗时过长，按抽样行的耗时外推（输出中标注 "估算"），
+# 并对抽样行核对相似标题数：行一致率与召回率（稀疏连接只会漏计、不会多计）。
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aggregator.cluster import MINIBATCH_MIN, build_clusters
+from aggregator.dedup_cluster import cluster_items, title_sim
+from aggregator.schema import Item
+from aggregator.score import calc_similarity, normalize_title, similar_title_counts, SIM_THRESHOLD
+
+# 常用汉字区间，按 Zipf 分布取字，使高频字（类似"的""在""中"）在大量标题中重复出现
+CHARS = [chr(code) for code in range(0x4E00, 0x4E00 + 3000)]
+
+
+def synthetic_vocabulary(rnd: random.Random, size: int = 8000):
+    weights = [1.0 / (rank + 1) for rank in range(len(CHARS))]
+    return [
+        "".join(rnd.choices(CHARS, weights, k=rnd.choice((2, 2, 3, 4))))
+        for _ in range(size)
+    ]
+
+
+def synthetic_titles(n: int, seed: int = 7):
+    """生成带近似重复的标题：约三成标题是已有标题的转载或小改动"""
+    rnd = random.Random(seed)
+    vocabulary = synthetic_vocabulary(rnd)
+    word_weights = [1.0 / (rank + 1) ** 0.8 for rank in range(len(vocabulary))]
+    titles = []
+    for _ in range(n):
+        if titles and rnd.random() < 0.3:
+            words = list(rnd.choice(titles).split(" "))
+            op = rnd.random()
+            if op < 0.4:
+                words[rnd.randrange(len(words))] = rnd.choice(vocabulary)
+            elif op < 0.7:
+                words.append(rnd.choice(vocabulary))
+            titles.append(" ".join(words))
+        else:
+            k = rnd.randint(4, 9)
+            words = rnd.choices(vocabulary, word_weights, k=k)
+            if rnd.random() < 0.3:
+                words.insert(rnd.randrange(k), str(rnd.randint(1, 999)))
+            titles.append(" ".join(words))
+    return titles
+
+
+def brute_force_count(normalized, idx, threshold):
+    this = normalized[idx]
+    return sum(
+        1 for j, other in enumerate(normalized)
+        if idx != j and calc_similarity(this, other) > threshold
+    )
+
+
+def bench_heat(sizes=(1000, 10000, 50000), sample_rows=100, threshold=SIM_THRESHOLD):
+    print(f"相似标题计数（阈值 {threshold}）")
+    print(f"{'规模':>8} {'两两比对(s)':>14} {'稀疏(s)':>10} {'加速比':>8}  校验")
+    for n in sizes:
+        normalized = [normalize_title(t) for t in synthetic_titles(n)]
+
+        start = time.perf_counter()
+        counts = similar_title_counts(normalized, threshold)
+        fast = time.perf_counter() - start
+
+        if n <= 1000:
+            rows = range(n)
+        else:
+            rows = random.Random(n).sample(range(n), sample_rows)
+        start = time.perf_counter()
+        expected = {i: brute_force_count(normalized, i, threshold) for i in rows}
+        brute = (time.perf_counter() - start) * n / len(rows)
+
+        same = sum(1 for i, c in expected.items() if counts[i] == c)
+        found = sum(counts[i] for i in expected)
+        recall = found / max(1, sum(expected.values()))
+        label = "" if n <= 1000 else "（估算）"
+        print(
+            f"{n:>8} {brute:>12.2f}{label:<2} {fast:>10.3f} {brute / fast:>7.0f}x  "
+            f"行一致 {same}/{len(expected)}，召回 {recall:.1%}"
+        )
+
+
+def synthetic_items(n: int, seed: int = 11):
+    """一天的条目：在合成标题基础上，约四分之一是其他平台对已有标题的原样转载"""
+    rnd = random.Random(seed)
+    items = []
+    for i, title in enumerate(synthetic_titles(n, seed)):
+        if items and rnd.random() < 0.25:
+            title = rnd.choice(items).title
+        source = f"src{rnd.randrange(12)}"
+        items.append(Item.make(title, f"https://example.com/{i}", source, ts=1700000000 + i * 4))
+    return items
+
+
+def brute_force_cluster(items, threshold=0.85):
+    """原实现：逐条与全部已有簇的代表标题比较，返回 (簇, 比较次数)"""
+    topics = []
+    comparisons = 0
+    for it in items:
+        for tp in topics:
+            comparisons += 1
+            if title_sim(tp["rep_title"], it.title) >= threshold:
+                tp["items"].append(it)
+                break
+        else:
+            topics.append({"rep_title": it.title, "items": [it]})
+    return topics, comparisons
+
+
+def cluster_signature(topics):
+    return sorted(tuple(i.id for i in tp["items"]) for tp in topics)
+
+
+def brute_force_comparisons(items, topics):
+    """由聚类结果推算原实现的比较次数：归入第 k 个簇比较 k+1 次，新建簇比较全部已有簇"""
+    position = {id(it): i for i, it in enumerate(items)}
+    creators = sorted(position[id(tp["items"][0])] for tp in topics)
+    order = {c: k for k, c in enumerate(creators)}
+    comparisons = 0
+    for tp in topics:
+        rank = order[position[id(tp["items"][0])]]
+        comparisons += rank + (len(tp["items"]) - 1) * (rank + 1)
+    return comparisons
+
+
+def bench_cluster(n=20000, check_n=2000, threshold=0.85):
+    print(f"贪心聚类（阈值 {threshold}）")
+    items = synthetic_items(n)
+
+    sample = items[:check_n]
+    start = time.perf_counter()
+    expected, sample_comparisons = brute_force_cluster(sample, threshold)
+    per_comparison = (time.perf_counter() - start) / max(1, sample_comparisons)
+    ok = cluster_signature(cluster_items(sample, threshold)) == cluster_signature(expected)
+    print(f"  前 {check_n} 条逐簇比对结果{'一致' if ok else '不一致'}（{len(expected)} 个簇）")
+
+    start = time.perf_counter()
+    topics = cluster_items(items, threshold)
+    fast = time.perf_counter() - start
+    brute = brute_force_comparisons(items, topics) * per_comparison
+    print(
+        f"  {n} 条 → {len(topics)} 个簇：逐簇比对 {brute:.1f}s（估算），"
+        f"倒排索引 {fast:.3f}s，加速 {brute / fast:.0f}x"
+    )
+
+
+def bench_kmeans(sizes=(2000, 20000)):
+    print(f"主题聚类（自动选 k，{MINIBATCH_MIN} 条起用 MiniBatchKMeans）")
+    for n in sizes:
+        clusters, timings = build_clusters(synthetic_items(n))
+        stages = "，".join(f"{stage} {seconds:.2f}s" for stage, seconds in timings.items())
+        backend = "MiniBatchKMeans" if n >= MINIBATCH_MIN else "KMeans"
+        print(f"  {n} 条 → {len(clusters)} 个簇（{backend}）：{stages}")
+
+
+if __name__ == "__main__":
+    commands = {"heat": bench_heat, "cluster": bench_cluster, "kmeans": bench_kmeans}
+    names = sys.argv[1:] or list(commands)
+    for name in names:
+        commands[name]()
@@ -0,0 +1,410 @@
+# tools/bench_report.py
+# 作用：分批消息拼装的等价性校验与基准测试（合成报告，不访问网络）
+#   python tools/bench_report.py check   # 大报告上与改写前实现逐批对比（多种渠道、上限、模式）
+#   python tools/bench_report.py bench   # 10k 条标题的分批耗时对比
+
+import os
+import random
+import sys
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main  # noqa: E402
+
+# 页脚含当前时间，固定下来保证两次拼装可比
+FIXED_NOW = datetime(2025, 1, 1, 12, 0, 0)
+main.get_beijing_time = lambda: FIXED_NOW
+
+SOURCES = ["微博", "知乎", "百度热搜", "今日头条", "抖音", "B站", "财联社"]
+WORDS = ["人工智能", "新能源", "芯片", "房地产", "世界杯", "航天", "教育", "医疗", "汽车", "A股"]
+
+
+def synthetic_report(n_titles: int, seed: int = 3, failed: int = 3) -> Dict:
+    """生成 prepare_report_data 形状的报告：约九成标题在词组统计中，其余为新增"""
+    rnd = random.Random(seed)
+
+    def make_title(i, is_new=False):
+        ranks = sorted(rnd.sample(range(1, 51), rnd.randint(1, 4)))
+        first, last = f"{rnd.randint(0, 23):02d}时{rnd.randint(0, 59):02d}分", ""
+        if rnd.random() < 0.6:
+            last = f"{rnd.randint(0, 23):02d}时{rnd.randint(0, 59):02d}分"
+        title = {
+            "title": f"{rnd.choice(WORDS)}相关新闻第{i}条：" + "标题内容" * rnd.randint(1, 8),
+            "source_name": rnd.choice(SOURCES),
+            "time_display": "" if is_new else main.format_time_display(first, last),
+            "count": 1 if is_new else rnd.randint(1, 6),
+            "ranks": ranks,
+            "rank_threshold": 5,
+            "url": f"https://example.com/{i}" if rnd.random() < 0.8 else "",
+            "mobile_url": f"https://m.example.com/{i}" if rnd.random() < 0.3 else "",
+            "is_new": is_new or rnd.random() < 0.1,
+        }
+        return main.prepare_report_title(title)
+
+    n_new = n_titles // 10
+    stats = []
+    remaining = n_titles - n_new
+    i = 0
+    while remaining > 0:
+        size = min(remaining, rnd.randint(1, max(1, n_titles // 20)))
+        titles = [make_title(i + k) for k in range(size)]
+        i += size
+        remaining -= size
+        stats.append({"word": rnd.choice(WORDS) + str(len(stats)), "count": size, "percentage": 0, "titles": titles})
+    new_titles = []
+    for source in SOURCES:
+        share = n_new // len(SOURCES)
+        if share:
+            new_titles.append({
+                "source_id": source,
+                "source_name": source,
+                "titles": [make_title(i + k, is_new=True) for k in range(share)],
+            })
+            i += share
+    return {
+        "stats": stats,
+        "new_titles": new_titles,
+        "failed_ids": [f"platform-{k}" for k in range(failed)],
+        "total_new_count": sum(len(s["titles"]) for s in new_titles),
+    }
+
+
+def legacy_split_content_into_batches(
+        report_data: Dict,
+        format_type: str,
+        update_info: Optional[Dict] = None,
+        max_bytes: int = 4000,
+        mode: str = "daily",
+) -> List[str]:
+    """改写前的实现（逐条重新编码整个批次），仅作对照"""
+    batches = []
+
+    total_titles = sum(
+        len(stat["titles"]) for stat in report_data["stats"] if stat["count"] > 0
+    )
+    now = main.get_beijing_time()
+
+    base_header = ""
+    if format_type == "wework":
+        base_header = f"**总新闻数：** {total_titles}\n\n\n\n"
+    elif format_type == "telegram":
+        base_header = f"总新闻数： {total_titles}\n\n"
+
+    base_footer = ""
+    if format_type == "wework":
+        base_footer = f"\n\n\n> 更新时间：{now.strftime('%Y-%m-%d %H:%M:%S')}"
+        if update_info:
+            base_footer += f"\n> TrendRadar 发现新版本 **{update_info['remote_version']}**，当前 **{update_info['current_version']}**"
+    elif format_type == "telegram":
+        base_footer = f"\n\n更新时间：{now.strftime('%Y-%m-%d %H:%M:%S')}"
+        if update_info:
+            base_footer += f"\nTrendRadar 发现新版本 {update_info['remote_version']}，当前 {update_info['current_version']}"
+
+    stats_header = ""
+    if report_data["stats"]:
+        if format_type == "wework":
+            stats_header = f"📊 **热点词汇统计**\n\n"
+        elif format_type == "telegram":
+            stats_header = f"📊 热点词汇统计\n\n"
+
+    current_batch = base_header
+    current_batch_has_content = False
+
+    if (
+            not report_data["stats"]
+            and not report_data["new_titles"]
+            and not report_data["failed_ids"]
+    ):
+        if mode == "incremental":
+            mode_text = "增量模式下暂无新增匹配的热点词汇"
+        elif mode == "current":
+            mode_text = "当前榜单模式下暂无匹配的热点词汇"
+        else:
+            mode_text = "暂无匹配的热点词汇"
+        simple_content = f"📭 {mode_text}\n\n"
+        final_content = base_header + simple_content + base_footer
+        batches.append(final_content)
+        return batches
+
+    # 处理热点词汇统计
+    if report_data["stats"]:
+        total_count = len(report_data["stats"])
+
+        # 添加统计标题
+        test_content = current_batch + stats_header
+        if (
+                len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
+                < max_bytes
+        ):
+            current_batch = test_content
+            current_batch_has_content = True
+        else:
+            if current_batch_has_content:
+                batches.append(current_batch + base_footer)
+            current_batch = base_header + stats_header
+            current_batch_has_content = True
+
+        # 逐个处理词组（确保词组标题+第一条新闻的原子性）
+        for i, stat in enumerate(report_data["stats"]):
+            word = stat["word"]
+            count = stat["count"]
+            sequence_display = f"[{i + 1}/{total_count}]"
+
+            # 构建词组标题
+            word_header = ""
+            if format_type == "wework":
+                if count >= 10:
+                    word_header = (
+                        f"🔥 {sequence_display} **{word}** : **{count}** 条\n\n"
+                    )
+                elif count >= 5:
+                    word_header = (
+                        f"📈 {sequence_display} **{word}** : **{count}** 条\n\n"
+                    )
+                else:
+                    word_header = f"📌 {sequence_display} **{word}** : {count} 条\n\n"
+            elif format_type == "telegram":
+                if count >= 10:
+                    word_header = f"🔥 {sequence_display} {word} : {count} 条\n\n"
+                elif count >= 5:
+                    word_header = f"📈 {sequence_display} {word} : {count} 条\n\n"
+                else:
+                    word_header = f"📌 {sequence_display} {word} : {count} 条\n\n"
+
+            # 构建第一条新闻
+            first_news_line = ""
+            if stat["titles"]:
+                formatted_title = main.format_batch_title(format_type, stat["titles"][0])
+
+                first_news_line = f"  1. {formatted_title}\n"
+                if len(stat["titles"]) > 1:
+                    first_news_line += "\n"
+
+            # 原子性检查：词组标题+第一条新闻必须一起处理
+            word_with_first_news = word_header + first_news_line
+            test_content = current_batch + word_with_first_news
+
+            if (
+                    len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
+                    >= max_bytes
+            ):
+                # 当前批次容纳不下，开启新批次
+                if current_batch_has_content:
+                    batches.append(current_batch + base_footer)
+                current_batch = base_header + stats_header + word_with_first_news
+                current_batch_has_content = True
+                start_index = 1
+            else:
+                current_batch = test_content
+                current_batch_has_content = True
+                start_index = 1
+
+            # 处理剩余新闻条目
+            for j in range(start_index, len(stat["titles"])):
+                formatted_title = main.format_batch_title(format_type, stat["titles"][j])
+
+                news_line = f"  {j + 1}. {formatted_title}\n"
+                if j < len(stat["titles"]) - 1:
+                    news_line += "\n"
+
+                test_content = current_batch + news_line
+                if (
+                        len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
+                        >= max_bytes
+                ):
+                    if current_batch_has_content:
+                        batches.append(current_batch + base_footer)
+                    current_batch = base_header + stats_header + word_header + news_line
+                    current_batch_has_content = True
+                else:
+                    current_batch = test_content
+                    current_batch_has_content = True
+
+            # 词组间分隔符
+            if i < len(report_data["stats"]) - 1:
+                separator = ""
+                if format_type == "wework":
+                    separator = f"\n\n\n\n"
+                elif format_type == "telegram":
+                    separator = f"\n\n"
+
+                test_content = current_batch + separator
+                if (
+                        len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
+                        < max_bytes
+                ):
+                    current_batch = test_content
+
+    # 处理新增新闻（同样确保来源标题+第一条新闻的原子性）
+    if report_data["new_titles"]:
+        new_header = ""
+        if format_type == "wework":
+            new_header = f"\n\n\n\n🆕 **本次新增热点新闻** (共 {report_data['total_new_count']} 条)\n\n"
+        elif format_type == "telegram":
+            new_header = (
+                f"\n\n🆕 本次新增热点新闻 (共 {report_data['total_new_count']} 条)\n\n"
+            )
+
+        test_content = current_batch + new_header
+        if (
+                len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
+                >= max_bytes
+        ):
+            if current_batch_has_content:
+                batches.append(current_batch + base_footer)
+            current_batch = base_header + new_header
+            current_batch_has_content = True
+        else:
+            current_batch = test_content
+            current_batch_has_content = True
+
+        # 逐个处理新增新闻来源
+        for source_data in report_data["new_titles"]:
+            source_header = ""
+            if format_type == "wework":
+                source_header = f"**{source_data['source_name']}** ({len(source_data['titles'])} 条):\n\n"
+            elif format_type == "telegram":
+                source_header = f"{source_data['source_name']} ({len(source_data['titles'])} 条):\n\n"
+
+            # 构建第一条新增新闻
+            first_news_line = ""
+            if source_data["titles"]:
+                formatted_title = main.format_batch_title(
+                    format_type, source_data["titles"][0], show_source=False, is_new=False
+                )
+
+                first_news_line = f"  1. {formatted_title}\n"
+
+            # 原子性检查：来源标题+第一条新闻
+            source_with_first_news = source_header + first_news_line
+            test_content = current_batch + source_with_first_news
+
+            if (
+                    len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
+                    >= max_bytes
+            ):
+                if current_batch_has_content:
+                    batches.append(current_batch + base_footer)
+                current_batch = base_header + new_header + source_with_first_news
+                current_batch_has_content = True
+                start_index = 1
+            else:
+                current_batch = test_content
+                current_batch_has_content = True
+                start_index = 1
+
+            # 处理剩余新增新闻
+            for j in range(start_index, len(source_data["titles"])):
+                formatted_title = main.format_batch_title(
+                    format_type, source_data["titles"][j], show_source=False, is_new=False
+                )
+
+                news_line = f"  {j + 1}. {formatted_title}\n"
+
+                test_content = current_batch + news_line
+                if (
+                        len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
+                        >= max_bytes
+                ):
+                    if current_batch_has_content:
+                        batches.append(current_batch + base_footer)
+                    current_batch = base_header + new_header + source_header + news_line
+                    current_batch_has_content = True
+                else:
+                    current_batch = test_content
+                    current_batch_has_content = True
+
+            current_batch += "\n"
+
+    if report_data["failed_ids"]:
+        failed_header = ""
+        if format_type == "wework":
+            failed_header = f"\n\n\n\n⚠️ **数据获取失败的平台：**\n\n"
+        elif format_type == "telegram":
+            failed_header = f"\n\n⚠️ 数据获取失败的平台：\n\n"
+
+        test_content = current_batch + failed_header
+        if (
+                len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
+                >= max_bytes
+        ):
+            if current_batch_has_content:
+                batches.append(current_batch + base_footer)
+            current_batch = base_header + failed_header
+            current_batch_has_content = True
+        else:
+            current_batch = test_content
+            current_batch_has_content = True
+
+        for i, id_value in enumerate(report_data["failed_ids"], 1):
+            failed_line = f"  • {id_value}\n"
+            test_content = current_batch + failed_line
+            if (
+                    len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
+                    >= max_bytes
+            ):
+                if current_batch_has_content:
+                    batches.append(current_batch + base_footer)
+                current_batch = base_header + failed_header + failed_line
+                current_batch_has_content = True
+            else:
+                current_batch = test_content
+                current_batch_has_content = True
+
+    # 完成最后批次
+    if current_batch_has_content:
+        batches.append(current_batch + base_footer)
+
+    return batches
+
+
+def check(sizes=(0, 50, 2000, 10000)):
+    update_info = {"remote_version": "9.9.9", "current_version": "2.2.0"}
+    cases = 0
+    for n in sizes:
+        report = synthetic_report(n, failed=0 if n == 0 else 3)
+        for format_type in ("wework", "telegram", "other"):
+            for max_bytes in (300, 1000, 4000, 20000):
+                for info in (None, update_info):
+                    for mode in ("daily", "incremental"):
+                        expected = legacy_split_content_into_batches(report, format_type, info, max_bytes, mode)
+                        actual = main.split_content_into_batches(report, format_type, info, max_bytes, mode)
+                        cases += 1
+                        if actual != expected:
+                            print(f"不一致：{n} 条 {format_type} 上限 {max_bytes} {mode}")
+                            return False
+    print(f"分批结果一致（{cases} 组参数）")
+    return True
+
+
+def bench(n=10000, limits=(4000, 20000, 100000)):
+    """批次越大，逐条重编码整个批次的开销越明显"""
+    report = synthetic_report(n)
+    for format_type in ("wework", "telegram"):
+        # 预热标题片段缓存，只比较分批本身
+        main.split_content_into_batches(report, format_type)
+    print(f"{n} 条标题分批")
+    for max_bytes in limits:
+        for format_type in ("wework", "telegram"):
+            start = time.perf_counter()
+            legacy = legacy_split_content_into_batches(report, format_type, None, max_bytes)
+            old = time.perf_counter() - start
+            start = time.perf_counter()
+            batches = main.split_content_into_batches(report, format_type, None, max_bytes)
+            new = time.perf_counter() - start
+            print(
+                f"  上限 {max_bytes:>6} 字节 {format_type:<8} {len(batches):>4} 批："
+                f"逐条重编码 {old:.3f}s，累计字节数 {new:.3f}s，加速 {old / new:.1f}x  "
+                f"{'一致' if batches == legacy else '不一致'}"
+            )
+
+
+if __name__ == "__main__":
+    commands = {"check": check, "bench": bench}
+    names = sys.argv[1:] or list(commands)
+    for name in names:
+        commands[name]()